@@ -0,0 +1,231 @@
+"""Splitting long audio into chunks that can be transcribed in parallel."""
+
+import os
+import re
+import subprocess
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from itertools import count, pairwise, product
+from pathlib import Path
+from string import ascii_uppercase
+
+from .models import SentimentResult, SpeakerUtterance, TranscriptionResult
+
+# Silence quieter than this, lasting at least this long, is a candidate cut point
+SILENCE_NOISE_DB = -30
+SILENCE_MIN_SECONDS = 0.5
+
+# Audio shared by the chunks on both sides of each cut, so speakers heard
+# on both sides can be matched up and an utterance running across the cut
+# is heard whole by the chunk it starts in
+CHUNK_OVERLAP_SECONDS = 15.0
+
+_SILENCE_RE = re.compile(r"silence_(start|end): (-?[\d.]+)")
+
+
+@dataclass(frozen=True, slots=True)
+class AudioChunk:
+    """A piece of a split audio file and the part of the timeline it owns."""
+
+    path: Path
+    # Where the chunk's audio starts in the original file
+    offset_ms: int
+    # Utterances starting in [keep_from_ms, keep_until_ms) come from this chunk;
+    # earlier ones are in the overlap already covered by the previous chunk.
+    # The audio runs on past keep_until_ms, so ones crossing it aren't cut off.
+    keep_from_ms: int
+    keep_until_ms: int | None
+
+
+def audio_duration_seconds(audio_file_path: Path) -> float:
+    """Return the duration of an audio file using ffprobe."""
+    completed = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0",
+         os.fspath(audio_file_path)],
+        capture_output=True, text=True, check=True,
+    )
+    return float(completed.stdout.strip())
+
+
+def detect_silences(audio_file_path: Path) -> list[tuple[float, float]]:
+    """Return (start, end) seconds of each silence in an audio file using ffmpeg's silencedetect."""
+    completed = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-nostats", "-i", os.fspath(audio_file_path),
+         "-af", f"silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_SECONDS}", "-f", "null", "-"],
+        capture_output=True, text=True, check=True,
+    )
+    return parse_silences(completed.stderr)
+
+
+def parse_silences(ffmpeg_output: str) -> list[tuple[float, float]]:
+    """Pair up the silence_start/silence_end lines silencedetect logs."""
+    silences = []
+    start = None
+    for kind, value in _SILENCE_RE.findall(ffmpeg_output):
+        if kind == "start":
+            start = float(value)
+        elif start is not None:
+            silences.append((start, float(value)))
+            start = None
+    return silences
+
+
+def plan_cut_points(
+    duration_s: float,
+    silences: Sequence[tuple[float, float]],
+    target_chunk_s: float
+) -> list[float]:
+    """
+    Choose where to cut audio into chunks of roughly ``target_chunk_s``.
+
+    Each cut is the middle of the silence closest to the target boundary,
+    within half a chunk of it; without one the audio is cut at the target.
+    Raises ValueError if ``target_chunk_s`` is not positive.
+    """
+    if target_chunk_s <= 0:
+        raise ValueError(f"Chunk length must be positive, got {target_chunk_s}")
+
+    midpoints = [(start + end) / 2 for start, end in silences]
+    cuts: list[float] = []
+    previous = 0.0
+    while duration_s - previous > target_chunk_s:
+        target = previous + target_chunk_s
+        candidates = [
+            m for m in midpoints
+            if abs(m - target) <= target_chunk_s / 2 and m > previous + CHUNK_OVERLAP_SECONDS
+        ]
+        cut = min(candidates, key=lambda m: abs(m - target), default=target)
+        if duration_s - cut < CHUNK_OVERLAP_SECONDS:
+            break
+        cuts.append(cut)
+        previous = cut
+    return cuts
+
+
+def split_audio(audio_file_path: Path, output_dir: Path, target_chunk_s: float = 300.0) -> list[AudioChunk]:
+    """
+    Split an audio file on silences into FLAC chunks in ``output_dir``.
+
+    Each chunk also includes ``CHUNK_OVERLAP_SECONDS`` of the audio on the
+    far side of each of its cuts. Audio too short to split is returned as a
+    single chunk pointing at the original file.
+    """
+    duration_s = audio_duration_seconds(audio_file_path)
+    cuts = plan_cut_points(duration_s, detect_silences(audio_file_path), target_chunk_s)
+    if not cuts:
+        return [AudioChunk(audio_file_path, 0, 0, None)]
+
+    chunks = []
+    for index, (start, end) in enumerate(pairwise([0.0, *cuts, duration_s])):
+        offset = max(0.0, start - CHUNK_OVERLAP_SECONDS)
+        until = min(duration_s, end + CHUNK_OVERLAP_SECONDS)
+        chunk_path = output_dir / f"chunk{index:03d}.flac"
+        subprocess.run(
+            ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-ss", f"{offset:.3f}",
+             "-i", os.fspath(audio_file_path), "-t", f"{until - offset:.3f}", "-vn", os.fspath(chunk_path)],
+            capture_output=True, check=True,
+        )
+        chunks.append(AudioChunk(
+            path=chunk_path,
+            offset_ms=round(offset * 1000),
+            keep_from_ms=round(start * 1000),
+            keep_until_ms=round(end * 1000) if index < len(cuts) else None,
+        ))
+    return chunks
+
+
+def stitch_results(
+    chunks: Sequence[AudioChunk],
+    results: Sequence[TranscriptionResult],
+    audio_file_path: Path,
+    processing_time_ms: int | None = None
+) -> TranscriptionResult:
+    """
+    Combine per-chunk results into one result on the original timeline.
+
+    Timestamps are shifted by each chunk's offset and overlapping audio is
+    only kept once. Speaker labels are independent per chunk, so each
+    chunk's speakers are matched to the previous chunk's by voting on how
+    long they talk over each other in the overlap; unmatched speakers get
+    new labels.
+    """
+    labels = _speaker_labels()
+    utterances: list[SpeakerUtterance] = []
+    sentiment_results: list[SentimentResult] | None = None
+    previous: list[SpeakerUtterance] = []
+
+    for chunk, result in zip(chunks, results, strict=True):
+        shifted = [
+            u.model_copy(update={"start": u.start + chunk.offset_ms, "end": u.end + chunk.offset_ms})
+            for u in result.utterances
+        ]
+        # Both chunks hold the audio on either side of the cut
+        mapping = _match_speakers(previous, shifted, chunk.keep_from_ms + round(CHUNK_OVERLAP_SECONDS * 1000))
+        for u in shifted:
+            if u.speaker not in mapping:
+                mapping[u.speaker] = next(labels)
+
+        previous = [
+            SpeakerUtterance(speaker=mapping[u.speaker], text=u.text, start=u.start, end=u.end, confidence=u.confidence)
+            for u in shifted
+        ]
+        utterances.extend(u for u in previous if _in_chunk(chunk, u.start))
+
+        if result.sentiment_results is not None:
+            sentiment_results = sentiment_results or []
+            kept = [s for s in result.sentiment_results if _in_chunk(chunk, s.start + chunk.offset_ms)]
+            for s in kept:
+                if s.speaker and s.speaker not in mapping:
+                    mapping[s.speaker] = next(labels)
+            sentiment_results.extend(
+                s.model_copy(update={
+                    "start": s.start + chunk.offset_ms,
+                    "end": s.end + chunk.offset_ms,
+                    "speaker": mapping[s.speaker] if s.speaker else s.speaker,
+                })
+                for s in kept
+            )
+
+    last_duration = results[-1].total_duration if results else None
+    return TranscriptionResult(
+        utterances=utterances,
+        total_duration=chunks[-1].offset_ms // 1000 + last_duration if last_duration is not None else None,
+        processing_time_ms=processing_time_ms,
+        audio_file=audio_file_path,
+        sentiment_results=sentiment_results,
+    )
+
+
+def _in_chunk(chunk: AudioChunk, start_ms: int) -> bool:
+    """Whether something starting at ``start_ms`` belongs to this chunk rather than a neighbour."""
+    return start_ms >= chunk.keep_from_ms and (chunk.keep_until_ms is None or start_ms < chunk.keep_until_ms)
+
+
+def _match_speakers(
+    previous: Sequence[SpeakerUtterance],
+    current: Sequence[SpeakerUtterance],
+    overlap_end_ms: int
+) -> dict[str, str]:
+    """Map this chunk's speaker labels to the previous chunk's by shared talk time in the overlap."""
+    votes: Counter[tuple[str, str]] = Counter()
+    for cur in current:
+        if cur.start >= overlap_end_ms:
+            continue
+        for prev in previous:
+            shared = min(cur.end, prev.end, overlap_end_ms) - max(cur.start, prev.start)
+            if shared > 0:
+                votes[cur.speaker, prev.speaker] += shared
+
+    mapping: dict[str, str] = {}
+    for (cur_speaker, prev_speaker), _ in votes.most_common():
+        if cur_speaker not in mapping and prev_speaker not in mapping.values():
+            mapping[cur_speaker] = prev_speaker
+    return mapping
+
+
+def _speaker_labels() -> Iterator[str]:
+    """Yield A, B, ..., Z, AA, AB, ... as AssemblyAI labels speakers."""
+    for width in count(1):
+        for letters in product(ascii_uppercase, repeat=width):
+            yield "".join(letters)
@@ -1,15 +1,33 @@
 """Command-line interface for Transcripter."""
 
-import argparse
+import math
+import os
+import stat
 import sys
+from collections import Counter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .config import get_config
-from .logging import configure_logging, get_logger
-from .speaker_naming_service import SpeakerNamingService
-from .transcription_service import TranscripterService, TranscriptionError
+from . import __version__
 
-logger = get_logger(__name__)
+if TYPE_CHECKING:
+    import argparse
+
+VERSION = f"Transcripter {__version__}"
+
+# Closing quote for each opening quote stripped from paths and names
+# Using Unicode escapes for smart quotes to avoid syntax conflicts
+_QUOTE_PAIRS = {
+    '"': '"',            # Standard double quotes
+    "'": "'",            # Standard single quotes
+    '`': '`',            # Backticks
+    '\u201c': '\u201d',  # Smart double quotes " "
+    '\u2018': '\u2019',  # Smart single quotes ' '
+    '«': '»',            # Guillemets
+    '‹': '›',            # Single guillemets
+    '\u201e': '\u201c',  # German-style double quotes „ "
+    '\u201a': '\u2019',  # German-style single quotes ‚ '
+}
 
 
 def strip_outer_quotes(text: str) -> str:
@@ -25,30 +43,12 @@ def strip_outer_quotes(text: str) -> str:
     - Guillemets: « »
     - Other quote-like characters
     """
-    if not text:
-        return text
-
     if len(text) < 2:
         return text
 
-    # Define quote pairs (opening, closing)
-    # Using Unicode escapes for smart quotes to avoid syntax conflicts
-    quote_pairs = [
-        ('"', '"'),           # Standard double quotes
-        ("'", "'"),           # Standard single quotes
-        ('`', '`'),           # Backticks
-        ('\u201c', '\u201d'), # Smart double quotes " "
-        ('\u2018', '\u2019'), # Smart single quotes ' '
-        ('«', '»'),           # Guillemets
-        ('‹', '›'),           # Single guillemets
-        ('\u201e', '\u201c'), # German-style double quotes „ "
-        ('\u201a', '\u2019'), # German-style single quotes ‚ '
-    ]
-
-    # Check each quote pair
-    for opening, closing in quote_pairs:
-        if text.startswith(opening) and text.endswith(closing):
-            return text[len(opening):-len(closing)]
+    closing = _QUOTE_PAIRS.get(text[0])
+    if closing is not None and text[-1] == closing:
+        return text[1:-1]
 
     return text
 
@@ -59,8 +59,23 @@ def path_with_quote_stripping(path_str: str) -> Path:
     return Path(cleaned_path)
 
 
-def create_parser() -> argparse.ArgumentParser:
+def positive_minutes(value: str) -> float:
+    """Parse a chunk length in minutes, rejecting zero, negative and non-finite values."""
+    import argparse
+
+    try:
+        minutes = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number of minutes: {value!r}") from None
+    if not math.isfinite(minutes) or minutes <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive number of minutes, got {value!r}")
+    return minutes
+
+
+def create_parser() -> "argparse.ArgumentParser":
     """Create command-line argument parser."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Speech-to-text utility with speaker diarization using AssemblyAI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -70,6 +85,7 @@ Examples:
   transcripter audio.wav output.srt --format srt
   transcripter /path/to/audio.mp3 /path/to/output.txt --verbose
   transcripter interview.mp3 --sentiment
+  transcripter podcast.mp3 --chunk-minutes 5
 
 Note: For multi-speaker audio, you'll be prompted to name speakers after transcription.
       Use --sentiment to enable sentiment analysis (POSITIVE, NEGATIVE, NEUTRAL) for each sentence.
@@ -91,9 +107,9 @@ Note: For multi-speaker audio, you'll be prompted to name speakers after transcr
 
     parser.add_argument(
         "--format",
-        choices=["txt", "srt"],
+        choices=["txt", "srt", "jsonl"],
         default="txt",
-        help="Output format: txt (default) or srt subtitle format"
+        help="Output format: txt (default), srt subtitle format or jsonl (one JSON object per utterance)"
     )
 
     parser.add_argument(
@@ -102,6 +118,13 @@ Note: For multi-speaker audio, you'll be prompted to name speakers after transcr
         help="Enable sentiment analysis for each sentence"
     )
 
+    parser.add_argument(
+        "--chunk-minutes",
+        type=positive_minutes,
+        metavar="MINUTES",
+        help="Split long audio on silences into pieces of about this length and transcribe them concurrently (requires ffmpeg)"
+    )
+
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -113,7 +136,7 @@ Note: For multi-speaker audio, you'll be prompted to name speakers after transcr
     parser.add_argument(
         "--version",
         action="version",
-        version="Transcripter 0.1.0"
+        version=VERSION
     )
 
     return parser
@@ -121,13 +144,14 @@ Note: For multi-speaker audio, you'll be prompted to name speakers after transcr
 
 def validate_inputs(input_file: Path, output_file: Path) -> None:
     """Validate input arguments."""
-    # Check if input file exists
-    if not input_file.exists():
+    # Check that the input exists and is a regular file with a single stat call
+    try:
+        mode = os.stat(input_file).st_mode
+    except (FileNotFoundError, NotADirectoryError):
         print(f"Error: Input file does not exist: {input_file}", file=sys.stderr)
         sys.exit(1)
 
-    # Check if input file is readable
-    if not input_file.is_file():
+    if not stat.S_ISREG(mode):
         print(f"Error: Input path is not a file: {input_file}", file=sys.stderr)
         sys.exit(1)
 
@@ -140,9 +164,23 @@ def validate_inputs(input_file: Path, output_file: Path) -> None:
 
 def main() -> None:
     """Main CLI entry point."""
+    # Answer a bare --version without importing argparse or building the parser
+    if sys.argv[1:] == ["--version"]:
+        print(VERSION)
+        sys.exit(0)
+
     parser = create_parser()
     args = parser.parse_args()
 
+    # Imported only after argument parsing so --help and --version don't pay
+    # for loading the AssemblyAI SDK, pydantic and structlog
+    from .config import get_config
+    from .logging import configure_logging, get_logger
+    from .speaker_naming_service import SpeakerNamingService
+    from .transcription_service import TranscripterService, TranscriptionError
+
+    logger = get_logger(__name__)
+
     # Configure logging
     config = get_config()
     log_level = "DEBUG" if args.verbose else config.log_level
@@ -175,15 +213,25 @@ def main() -> None:
         print(f"Transcribing {args.input_file}...")
         if args.sentiment:
             print("Sentiment analysis enabled - analyzing emotional tone of each sentence...")
-        result = service.transcribe_file(args.input_file, enable_sentiment_analysis=args.sentiment)
+        if args.chunk_minutes is not None:
+            import asyncio
+
+            result = asyncio.run(service.transcribe_file_parallel(
+                args.input_file,
+                enable_sentiment_analysis=args.sentiment,
+                chunk_seconds=args.chunk_minutes * 60,
+            ))
+        else:
+            result = service.transcribe_file(args.input_file, enable_sentiment_analysis=args.sentiment)
 
         # Save the transcript
         print(f"Saving transcript to {args.output_file}...")
         service.save_transcript(result, args.output_file, args.format)
 
-        # Handle speaker naming as part of default workflow
-        speakers_detected = len({utt.speaker for utt in result.utterances})
-        if speakers_detected > 0:  # Prompt for any number of speakers
+        # Handle speaker naming as part of default workflow; it edits
+        # "Speaker X:" labels, which JSONL output doesn't have
+        speakers_detected = result.speaker_count
+        if speakers_detected > 0 and args.format != "jsonl":  # Prompt for any number of speakers
             if speakers_detected == 1:
                 print("\nThere is only one speaker identified, would you like to customize the name label?")
                 rename_choice = input("Would you like to name the speaker? [Y/n]: ").strip().lower()
@@ -208,26 +256,26 @@ def main() -> None:
             else:
                 print("Skipping speaker naming.")
 
-        # Print summary
-        print("\nTranscription completed successfully!")
-        print(f"Speakers detected: {len({utt.speaker for utt in result.utterances})}")
-        print(f"Total utterances: {len(result.utterances)}")
+        # Print summary with a single write
+        summary = [
+            "\nTranscription completed successfully!",
+            f"Speakers detected: {speakers_detected}",
+            f"Total utterances: {len(result.utterances)}",
+        ]
         if result.total_duration:
             duration_min = result.total_duration / 60
-            print(f"Audio duration: {result.total_duration} seconds ({duration_min:.2f} minutes)")
+            summary.append(f"Audio duration: {result.total_duration} seconds ({duration_min:.2f} minutes)")
         if result.processing_time_ms:
-            print(f"Processing time: {result.processing_time_ms}ms")
+            summary.append(f"Processing time: {result.processing_time_ms}ms")
 
-        # Print sentiment analysis summary if available
+        # Add sentiment analysis summary if available
         if result.sentiment_results:
-            print("\nSentiment Analysis:")
-            print(f"  Total sentences analyzed: {len(result.sentiment_results)}")
-            sentiment_counts = {"POSITIVE": 0, "NEUTRAL": 0, "NEGATIVE": 0}
-            for sentiment in result.sentiment_results:
-                sentiment_counts[sentiment.sentiment] += 1
-            print(f"  POSITIVE: {sentiment_counts['POSITIVE']}")
-            print(f"  NEUTRAL: {sentiment_counts['NEUTRAL']}")
-            print(f"  NEGATIVE: {sentiment_counts['NEGATIVE']}")
+            sentiment_counts = Counter(sentiment.sentiment for sentiment in result.sentiment_results)
+            summary.append("\nSentiment Analysis:")
+            summary.append(f"  Total sentences analyzed: {len(result.sentiment_results)}")
+            summary.extend(f"  {label}: {sentiment_counts[label]}" for label in ("POSITIVE", "NEUTRAL", "NEGATIVE"))
+
+        sys.stdout.write("\n".join(summary) + "\n")
 
         logger.info("Transcription completed successfully")
 
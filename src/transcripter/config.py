@@ -1,12 +1,48 @@
 """Configuration management for Transcripter."""
 
 import contextvars
-import uuid
+import os
+import secrets
+from collections.abc import Mapping
 from functools import lru_cache
 from pathlib import Path
 
+import structlog
+from dotenv import dotenv_values
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+from pydantic_settings.sources import ENV_FILE_SENTINEL
+
+# Env files read by default, in increasing priority. They are kept out of
+# model_config so pydantic-settings' own dotenv source doesn't parse them on
+# every instantiation; _CachedDotEnvSettingsSource reads them instead.
+_ENV_FILES = (".env.local", ".env")
+
+
+@lru_cache
+def _read_env_file(file_path: Path, mtime_ns: int, encoding: str | None) -> Mapping[str, str | None]:
+    """Parse an env file once per modification time."""
+    return dotenv_values(file_path, encoding=encoding or "utf8")
+
+
+class _CachedDotEnvSettingsSource(DotEnvSettingsSource):
+    """Dotenv source that reuses parsed env files across config instances.
+
+    ``env_parse_none_str`` isn't applied to values read this way.
+    """
+
+    def _read_env_file(self, file_path: Path) -> Mapping[str, str | None]:
+        env_vars = _read_env_file(file_path.resolve(), os.stat(file_path).st_mtime_ns, self.env_file_encoding)
+        return {
+            key if self.case_sensitive else key.lower(): value
+            for key, value in env_vars.items()
+            if not (self.env_ignore_empty and value == "")
+        }
 
 
 class TranscripterConfig(BaseSettings):
@@ -20,18 +56,50 @@ class TranscripterConfig(BaseSettings):
     output_dir: Path = Field(default=Path("./data/output"), description="Output directory for transcripts")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
     timeout: int = Field(default=300, description="Request timeout in seconds")
+    webhook_url: str | None = Field(default=None, description="URL AssemblyAI calls when a transcript is ready")
+    max_poll_seconds: float = Field(default=-1, description="Maximum seconds to wait for a transcript (-1 for no limit)")
+    cache_dir: Path | None = Field(default=None, description="Directory for cached transcription results (unset to disable)")
+    max_concurrent_transcriptions: int = Field(default=5, ge=1, description="Maximum transcriptions in flight at once")
 
     model_config = SettingsConfigDict(
         env_prefix="TRANSCRIPTER_",
-        env_file=(".env.local", ".env"),
+        # Passed through untouched when no _env_file is given, telling the
+        # default apart from an explicit _env_file=None
+        env_file=ENV_FILE_SENTINEL,
         env_file_encoding="utf-8",
         case_sensitive=False
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Read .env files through a per-process cache."""
+        if isinstance(dotenv_settings, DotEnvSettingsSource):
+            dotenv_settings = _CachedDotEnvSettingsSource(
+                settings_cls,
+                env_file=_ENV_FILES if dotenv_settings.env_file == ENV_FILE_SENTINEL else dotenv_settings.env_file,
+                env_file_encoding=dotenv_settings.env_file_encoding,
+                case_sensitive=dotenv_settings.case_sensitive,
+                env_prefix=dotenv_settings.env_prefix,
+                env_nested_delimiter=dotenv_settings.env_nested_delimiter,
+                env_nested_max_split=dotenv_settings.env_nested_max_split,
+                env_ignore_empty=dotenv_settings.env_ignore_empty,
+                env_parse_none_str=dotenv_settings.env_parse_none_str,
+                env_parse_enums=dotenv_settings.env_parse_enums,
+            )
+        return init_settings, env_settings, dotenv_settings, file_secret_settings
+
     def model_post_init(self, __context) -> None:
         """Post-initialization setup."""
-        # Ensure output directory exists
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure output directory exists, skipping mkdir when it already does
+        if not self.output_dir.is_dir():
+            self.output_dir.mkdir(parents=True, exist_ok=True)
 
 
 # Correlation ID context for logging
@@ -39,8 +107,8 @@ correlation_id: contextvars.ContextVar[str] = contextvars.ContextVar('correlatio
 
 
 def generate_correlation_id() -> str:
-    """Generate a new correlation ID."""
-    return str(uuid.uuid4())
+    """Generate a new correlation ID (128 random bits as hex)."""
+    return secrets.token_hex(16)
 
 
 def get_correlation_id() -> str:
@@ -60,6 +128,7 @@ def get_correlation_id() -> str:
 def set_correlation_id(cid: str) -> None:
     """Set the correlation ID in the current context."""
     correlation_id.set(cid)
+    structlog.contextvars.bind_contextvars(correlation_id=cid)
 
 
 @lru_cache
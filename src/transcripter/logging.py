@@ -1,52 +1,118 @@
 """Structured logging setup with correlation IDs."""
 
+import atexit
 import logging
 import sys
-from typing import Any
+from typing import Any, TextIO
 
+import orjson
 import structlog
+from structlog.typing import Processor
 
 from .config import get_correlation_id
 
 
 def configure_logging(log_level: str = "INFO") -> None:
-    """Configure structured logging with correlation IDs."""
+    """Configure structured logging with correlation IDs.
+
+    Events are rendered straight to bytes with orjson and written by
+    structlog's BytesLogger, bypassing the standard library logging stack.
+    """
+    level = getattr(logging, log_level.upper())
+
+    # Bound once here and merged into each event from structlog's context
+    structlog.contextvars.bind_contextvars(correlation_id=get_correlation_id())
+
+    processors: list[Processor] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+    ]
+    # Stack rendering is only useful when debugging
+    if level <= logging.DEBUG:
+        processors.append(structlog.processors.StackInfoRenderer())
+    processors += [
+        structlog.processors.format_exc_info,
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
+    ]
 
     # Configure structlog
     structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            add_correlation_id,
-            structlog.processors.JSONRenderer()
-        ],
+        processors=processors,
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.BytesLoggerFactory(_log_sink(level)),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         cache_logger_on_first_use=True,
     )
 
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
-    )
 
+class _TextWriter:
+    """Byte sink that writes rendered events through a text stream.
+
+    Writing to ``sys.stdout.buffer`` directly would let events overtake
+    print() output still held in the text layer when stdout is piped; going
+    through the one stream keeps them in order.
+    """
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+
+    def write(self, data: bytes) -> None:
+        """Write an event rendered as UTF-8 bytes."""
+        self._stream.write(data.decode())
+
+    def flush(self) -> None:
+        """Flush the underlying stream."""
+        self._stream.flush()
+
+
+class _CoalescingWriter(_TextWriter):
+    """Text writer that leaves flushing to the stream's own buffer.
+
+    BytesLogger flushes after every event, which would turn each event into its
+    own write syscall. Ignoring those flushes lets events pile up in stdout's
+    buffer until it fills, something else flushes stdout, or the process exits.
+    """
+
+    def flush(self) -> None:
+        """Leave flushing to the underlying stream."""
 
-def add_correlation_id(logger: Any, method_name: str, event_dict: Any) -> Any:
-    """Add correlation ID to log events."""
-    event_dict["correlation_id"] = get_correlation_id()
-    return event_dict
 
+def _log_sink(level: int) -> Any:
+    """Return the byte sink log events are written to.
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+    Verbose runs flush each event so debug output shows up as it happens;
+    otherwise events are coalesced and flushed at exit or before an uncaught
+    exception is reported.
+    """
+    if level <= logging.DEBUG:
+        return _TextWriter(sys.stdout)
+
+    _install_flush_hooks()
+    return _CoalescingWriter(sys.stdout)
+
+
+_hooks_installed = False
+
+
+def _install_flush_hooks() -> None:
+    """Flush stdout at exit and before uncaught exceptions, once so reconfiguring doesn't stack hooks."""
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    _hooks_installed = True
+
+    atexit.register(sys.stdout.flush)
+
+    previous_excepthook = sys.excepthook
+
+    def flush_then_report(exc_type, exc_value, traceback) -> None:
+        sys.stdout.flush()
+        previous_excepthook(exc_type, exc_value, traceback)
+
+    sys.excepthook = flush_then_report
+
+
+def get_logger(name: str) -> structlog.typing.FilteringBoundLogger:
     """Get a structured logger instance."""
     return structlog.get_logger(name)
-
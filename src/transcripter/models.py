@@ -1,9 +1,15 @@
 """Data models for transcription results."""
 
+import sys
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 from typing import Literal
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 SentimentType = Literal["POSITIVE", "NEUTRAL", "NEGATIVE"]
 
@@ -11,6 +17,8 @@ SentimentType = Literal["POSITIVE", "NEUTRAL", "NEGATIVE"]
 class SentimentResult(BaseModel):
     """Sentiment analysis result for a text segment."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     text: str = Field(..., description="Text that was analyzed")
     sentiment: SentimentType = Field(..., description="Detected sentiment")
     confidence: float = Field(..., description="Confidence score (0-1)")
@@ -22,67 +30,109 @@ class SentimentResult(BaseModel):
 class SpeakerUtterance(BaseModel):
     """Represents a single utterance by a speaker."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     speaker: str = Field(..., description="Speaker identifier")
     text: str = Field(..., description="Transcribed text")
     start: int = Field(..., description="Start time in milliseconds")
     end: int = Field(..., description="End time in milliseconds")
     confidence: float | None = Field(None, description="Confidence score (0-1)")
 
+    @field_validator("speaker")
+    @classmethod
+    def _intern_speaker(cls, value: str) -> str:
+        """Share one string object per speaker label across utterances."""
+        return sys.intern(value)
+
 
 class TranscriptionResult(BaseModel):
     """Complete transcription result with speaker diarization."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     utterances: list[SpeakerUtterance] = Field(default_factory=list, description="List of speaker utterances")
     total_duration: int | None = Field(None, description="Total audio duration in seconds")
     processing_time_ms: int | None = Field(None, description="Processing time in milliseconds")
     audio_file: Path = Field(..., description="Path to the source audio file")
     sentiment_results: list[SentimentResult] | None = Field(None, description="Sentiment analysis results if enabled")
 
+    @property
+    def speaker_count(self) -> int:
+        """Number of distinct speakers; not cached, as model_copy would carry a stale count over."""
+        return len(set(map(attrgetter("speaker"), self.utterances)))
+
     def to_transcript_text(self) -> str:
         """Convert to readable transcript format with optional sentiment analysis."""
-        lines = []
-        for utterance in self.utterances:
-            speaker_line = f"Speaker {utterance.speaker}: {utterance.text}"
-            lines.append(speaker_line)
+        return "\n\n".join(self._transcript_entries())
+
+    def iter_transcript_lines(self) -> Iterator[str]:
+        """Yield the transcript text one entry at a time, separators included.
+
+        Joining the pieces gives exactly ``to_transcript_text()``.
+        """
+        entries = self._transcript_entries()
+        first = next(entries, None)
+        if first is None:
+            return
+        yield first
+        for entry in entries:
+            yield f"\n\n{entry}"
+
+    def _transcript_entries(self) -> Iterator[str]:
+        """Utterance lines followed by the optional sentiment analysis section."""
+        lines: Iterator[str] = (f"Speaker {u.speaker}: {u.text}" for u in self.utterances)
 
         # Add sentiment analysis section if available
         if self.sentiment_results:
-            lines.append("\n" + "="*60)
-            lines.append("SENTIMENT ANALYSIS")
-            lines.append("="*60)
-            for sentiment in self.sentiment_results:
-                sentiment_line = f"[{sentiment.sentiment}] (confidence: {sentiment.confidence:.2f})"
-                if sentiment.speaker:
-                    sentiment_line = f"Speaker {sentiment.speaker} - {sentiment_line}"
-                sentiment_line += f"\n{sentiment.text}"
-                lines.append(sentiment_line)
-
-        return "\n\n".join(lines)
+            rule = "=" * 60
+            lines = chain(
+                lines,
+                (f"\n{rule}", "SENTIMENT ANALYSIS", rule),
+                (self._sentiment_line(sentiment) for sentiment in self.sentiment_results),
+            )
+
+        return lines
 
     def to_srt_format(self) -> str:
         """Convert to SRT subtitle format."""
-        lines = []
-        for i, utterance in enumerate(self.utterances, 1):
-            # Convert milliseconds to SRT time format
-            start_time = self._ms_to_srt_time(utterance.start)
-            end_time = self._ms_to_srt_time(utterance.end)
-
-            lines.append(f"{i}")
-            lines.append(f"{start_time} --> {end_time}")
-            lines.append(f"Speaker {utterance.speaker}: {utterance.text}")
-            lines.append("")  # Empty line between entries
+        return "".join(self.iter_srt_cues())
+
+    def iter_srt_cues(self) -> Iterator[str]:
+        """Yield SRT cues one utterance at a time.
+
+        Each cue is its index, time range and text, with an empty line between
+        cues. Joining the pieces gives exactly ``to_srt_format()``.
+        """
+        srt_time = self._ms_to_srt_time
+        separator = ""
+        for i, u in enumerate(self.utterances, 1):
+            yield f"{separator}{i}\n{srt_time(u.start)} --> {srt_time(u.end)}\nSpeaker {u.speaker}: {u.text}\n"
+            separator = "\n"
+
+    def iter_jsonl(self) -> Iterator[bytes]:
+        """Yield one UTF-8 JSON object per utterance, each on its own line."""
+        dumps = orjson.dumps
+        for u in self.utterances:
+            record = {"speaker": u.speaker, "start": u.start, "end": u.end, "text": u.text}
+            yield dumps(record, option=orjson.OPT_APPEND_NEWLINE)
 
-        return "\n".join(lines)
+    @staticmethod
+    def _sentiment_line(sentiment: SentimentResult) -> str:
+        """Format a sentiment result for the transcript text."""
+        line = f"[{sentiment.sentiment}] (confidence: {sentiment.confidence:.2f})\n{sentiment.text}"
+        if sentiment.speaker:
+            return f"Speaker {sentiment.speaker} - {line}"
+        return line
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _ms_to_srt_time(ms: int) -> str:
-        """Convert milliseconds to SRT time format (HH:MM:SS,mmm)."""
-        seconds = ms // 1000
-        milliseconds = ms % 1000
-        minutes = seconds // 60
-        seconds = seconds % 60
-        hours = minutes // 60
-        minutes = minutes % 60
+        """Convert milliseconds to SRT time format (HH:MM:SS,mmm).
 
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+        Cached because utterance boundaries often repeat across a transcript.
+        """
+        seconds, milliseconds = divmod(ms, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
 
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
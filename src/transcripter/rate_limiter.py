@@ -0,0 +1,59 @@
+"""Client-side rate limiting for API calls."""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket that paces callers to stay under a request rate.
+
+    The bucket starts full, so bursts up to ``capacity`` go through
+    immediately; after that callers wait for tokens to refill at ``rate``
+    per second. Safe to share across event loops and threads.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Create a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens the bucket holds
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self, tokens: float) -> float:
+        """Take tokens if available; otherwise return how long to wait for them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def _check_capacity(self, tokens: float) -> None:
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of {self.capacity}")
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until ``tokens`` are available and take them."""
+        self._check_capacity(tokens)
+        while delay := self._try_acquire(tokens):
+            await asyncio.sleep(delay)
+
+    def wait(self, tokens: float = 1) -> None:
+        """Blocking ``acquire`` for synchronous callers."""
+        self._check_capacity(tokens)
+        while delay := self._try_acquire(tokens):
+            time.sleep(delay)
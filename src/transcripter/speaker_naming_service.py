@@ -1,12 +1,19 @@
 """Speaker naming service for interactive speaker identification and renaming."""
 
+import mmap
+import os
 import re
+import sys
+from collections import defaultdict
 from pathlib import Path
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Matches each "Speaker X: text" line of a transcript
+_SPEAKER_RE = re.compile(rb'^Speaker ([A-Z]+):[ \t]*(.+)', re.MULTILINE)
+
 
 class SpeakerNamingService:
     """Service for interactive speaker naming in transcription files."""
@@ -19,9 +26,22 @@ class SpeakerNamingService:
         """
         self.transcript_file = transcript_file
         self.speakers: dict[str, str] = {}  # Original -> New name mapping
-        self.utterances: list[tuple[str, str]] = []  # (speaker, content) pairs
+        self.utterances = []  # (speaker, content) pairs
         self.speaker_utterance_indices: dict[str, int] = {}  # Track current utterance index for each speaker
 
+    @property
+    def utterances(self) -> list[tuple[str, str]]:
+        """(speaker, content) pairs in transcript order."""
+        return self._utterances
+
+    @utterances.setter
+    def utterances(self, utterances: list[tuple[str, str]]) -> None:
+        self._utterances = utterances
+        # Positions of each speaker's utterances, so lookups don't rescan the list
+        self._speaker_to_indices: defaultdict[str, list[int]] = defaultdict(list)
+        for index, (speaker, _) in enumerate(utterances):
+            self._speaker_to_indices[speaker].append(index)
+
     def analyze_transcript(self) -> bool:
         """Analyze the transcript to identify speakers and utterances.
 
@@ -29,30 +49,22 @@ class SpeakerNamingService:
             True if speakers were found, False otherwise
         """
         try:
-            with open(self.transcript_file, encoding='utf-8') as f:
-                content = f.read()
-
-            # Split into lines and process
-            lines = content.strip().split('\n')
-            speaker_pattern = re.compile(r'^Speaker ([A-Z]+):\s*(.+)$')
-
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                match = speaker_pattern.match(line)
-                if match:
-                    speaker_id = f"Speaker {match.group(1)}"
-                    utterance = match.group(2).strip()
-                    self.utterances.append((speaker_id, utterance))
-
-            # Extract unique speakers
-            unique_speakers = {speaker for speaker, _ in self.utterances}
-            self.speakers = {speaker: speaker for speaker in unique_speakers}
+            with open(self.transcript_file, 'rb') as f:
+                # Empty files can't be mapped, and have no speakers anyway
+                if os.fstat(f.fileno()).st_size:
+                    # Scan the mapped file in place rather than copying it into memory
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        # One regex scan over the whole transcript is faster than matching line by line
+                        for match in _SPEAKER_RE.finditer(content):
+                            speaker_id = sys.intern(f"Speaker {match.group(1).decode('ascii')}")
+                            utterance = match.group(2).rstrip().decode('utf-8')
+                            # Record each speaker on first sight, keeping transcript order
+                            self.speakers.setdefault(speaker_id, speaker_id)
+                            self._speaker_to_indices[speaker_id].append(len(self._utterances))
+                            self._utterances.append((speaker_id, utterance))
 
             # Initialize utterance indices for each speaker (start at 0 for first occurrence)
-            self.speaker_utterance_indices = dict.fromkeys(unique_speakers, 0)
+            self.speaker_utterance_indices = dict.fromkeys(self.speakers, 0)
 
             logger.info("Transcript analysis complete",
                        speakers_found=len(self.speakers),
@@ -76,11 +88,10 @@ class SpeakerNamingService:
         """
         context = []
 
-        # Find all utterances for this speaker
-        target_utterances = [(i, speaker, content) for i, (speaker, content)
-                           in enumerate(self.utterances) if speaker == speaker_id]
+        # Positions of all utterances for this speaker
+        indices = self._speaker_to_indices.get(speaker_id)
 
-        if not target_utterances:
+        if not indices:
             return context
 
         # Use tracked index if no specific index provided
@@ -88,11 +99,11 @@ class SpeakerNamingService:
             utterance_index = self.speaker_utterance_indices.get(speaker_id, 0)
 
         # Ensure index is within bounds
-        if utterance_index >= len(target_utterances):
-            utterance_index = len(target_utterances) - 1
+        if utterance_index >= len(indices):
+            utterance_index = len(indices) - 1
 
         # Get the target utterance index
-        target_index = target_utterances[utterance_index][0]
+        target_index = indices[utterance_index]
 
         # Special case: if this is the first utterance of the first speaker (index 0),
         # show current + next 2 instead of before/current/after
@@ -137,15 +148,16 @@ class SpeakerNamingService:
             print(f"No context found for {speaker_id}")
             return
 
-        print(f"\nContext for {speaker_id}:")
-        print("-" * 50)
-
+        # Build the whole block and print it with a single write
+        rule = "-" * 50
+        lines = [f"\nContext for {speaker_id}:", rule]
         for speaker, content in context:
             # Truncate content to 200 chars for readability
             truncated_content = content[:200] + "..." if len(content) > 200 else content
-            print(f"{speaker}: {truncated_content}")
+            lines.append(f"{speaker}: {truncated_content}")
+            lines.append(rule)
 
-            print("-" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def advance_speaker_utterance_index(self, speaker_id: str) -> bool:
         """Advance to the next utterance for a speaker.
@@ -156,17 +168,16 @@ class SpeakerNamingService:
         Returns:
             True if advanced successfully, False if no more utterances
         """
-        # Find all utterances for this speaker
-        target_utterances = [(i, speaker, content) for i, (speaker, content)
-                           in enumerate(self.utterances) if speaker == speaker_id]
+        # Positions of all utterances for this speaker
+        indices = self._speaker_to_indices.get(speaker_id)
 
-        if not target_utterances:
+        if not indices:
             return False
 
         current_index = self.speaker_utterance_indices.get(speaker_id, 0)
 
         # Advance to next utterance if available
-        if current_index < len(target_utterances) - 1:
+        if current_index < len(indices) - 1:
             self.speaker_utterance_indices[speaker_id] = current_index + 1
             return True
         else:
@@ -245,28 +256,31 @@ class SpeakerNamingService:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            with open(self.transcript_file, encoding='utf-8') as f:
-                content = f.read()
-
-            # Replace speaker names
-            for original_name, new_name in self.speakers.items():
-                if original_name != new_name:
-                    # Replace at the beginning of lines only
-                    pattern = f"^{re.escape(original_name)}:"
-                    replacement = f"{new_name}:"
-                    content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
+        renames = {original.encode('utf-8'): new.encode('utf-8')
+                   for original, new in self.speakers.items() if original != new}
+        # Write to a sibling file and swap it in, so only one line is held in
+        # memory and a failure part way through leaves the original intact
+        tmp_path = self.transcript_file.with_name(f"{self.transcript_file.name}.{os.getpid()}.tmp")
 
-            # Write back to file
-            with open(self.transcript_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+        try:
+            if renames:
+                with open(self.transcript_file, 'rb') as src, open(tmp_path, 'wb') as dst:
+                    for line in src:
+                        # Only a renamed label right at the start of a line, followed by a
+                        # colon, is replaced; one dict lookup covers every speaker
+                        label, colon, rest = line.partition(b':')
+                        if colon and (new := renames.get(label)) is not None:
+                            line = new + colon + rest
+                        dst.write(line)
+                os.replace(tmp_path, self.transcript_file)
 
             logger.info("Speaker names applied to transcript",
-                       replacements=len([k for k, v in self.speakers.items() if k != v]))
+                       replacements=len(renames))
 
             return True
 
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             logger.error("Failed to apply speaker names", error=str(e))
             return False
 
@@ -1,28 +1,114 @@
 """Core transcription service using AssemblyAI."""
 
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
 import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
+from typing import Any
 
 import assemblyai as aai
+from assemblyai import api as assemblyai_api
+from pydantic import TypeAdapter, ValidationError
 from tenacity import (
-    retry,
+    AsyncRetrying,
+    Retrying,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
 
+from .audio_chunking import split_audio, stitch_results
 from .config import TranscripterConfig, get_config, get_correlation_id
 from .logging import get_logger
 from .models import SentimentResult, SpeakerUtterance, TranscriptionResult
+from .rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 
+# Delay between transcript status polls: starts short so quick jobs are
+# picked up promptly, then backs off to spare API calls on long ones
+POLL_INITIAL_DELAY = 0.25
+POLL_BACKOFF = 1.5
+POLL_MAX_DELAY = 10.0
+
+# How long await_result waits for a webhook before checking the transcript
+# itself, in case the callback was lost or arrived before submit() registered it
+WEBHOOK_CHECK_INTERVAL = 30.0
+
+# HTTP requests Transcriber.submit makes for a local file: the upload, then
+# creating the transcript. Each takes a token from the rate limiter.
+SUBMIT_REQUESTS = 2
+
+# Only every Nth status poll is logged, to keep long waits from flooding the log
+POLL_LOG_EVERY = 10
+
+# AssemblyAI's API request limit, paced client-side for async callers
+API_RATE_LIMIT_REQUESTS = 20_000
+API_RATE_LIMIT_PERIOD_SECONDS = 300
+
+# Statuses after which a transcript won't change any more
+TERMINAL_STATUSES = frozenset({aai.TranscriptStatus.completed, aai.TranscriptStatus.error})
+
+# Validates a transcript's sentiment segments in one call, reading SDK attributes directly
+SENTIMENT_RESULTS_ADAPTER = TypeAdapter(list[SentimentResult])
+
+# Errors from a single API call that are worth retrying; anything else
+# (including a transcript that finished with an error) fails immediately
+RETRYABLE_ERRORS = (ConnectionError, TimeoutError, aai.TranscriptError)
+
+# Buffer size for writing transcripts, so output goes to disk in large blocks
+WRITE_BUFFER_SIZE = 1 << 16
+
+# How each output format renders a result, as a stream of text chunks
+TRANSCRIPT_WRITERS: dict[str, Callable[[TranscriptionResult], Iterable[str]]] = {
+    "txt": TranscriptionResult.iter_transcript_lines,
+    "srt": TranscriptionResult.iter_srt_cues,
+}
+
+# Formats rendered straight to encoded bytes, skipping the text layer
+BINARY_TRANSCRIPT_WRITERS: dict[str, Callable[[TranscriptionResult], Iterable[bytes]]] = {
+    "jsonl": TranscriptionResult.iter_jsonl,
+}
+
 
 class TranscriptionError(Exception):
     """Custom exception for transcription-related errors."""
     pass
 
 
+@dataclass(slots=True)
+class _PendingTranscript:
+    """A transcript submitted with ``submit`` whose result hasn't been collected."""
+
+    audio_file_path: Path
+    enable_sentiment_analysis: bool
+    submitted_at: float
+    # Resolved with the reported status when AssemblyAI calls the webhook
+    webhook_status: Future[str] = field(default_factory=Future)
+
+
+def _fetch_transcript(transcript_id: str) -> aai.Transcript:
+    """Fetch a transcript's current state with a single API request.
+
+    ``aai.Transcript.get_by_id`` can't be used for polling: it blocks, polling
+    on the SDK's own fixed interval, until the transcript has finished.
+    """
+    client = aai.Client.get_default()
+    return aai.Transcript.from_response(
+        client=client,
+        response=assemblyai_api.get_transcript(client.http_client, transcript_id),
+    )
+
+
 class TranscripterService:
     """Service for transcribing audio files with speaker diarization."""
 
@@ -37,13 +123,94 @@ class TranscripterService:
             raise TranscriptionError("AssemblyAI API key is required")
 
         aai.settings.api_key = self.config.assemblyai_api_key
+        self._transcription_configs: dict[tuple[bool, bool], aai.TranscriptionConfig] = {}
+        self._pending: dict[str, _PendingTranscript] = {}
+        self._rate_limiter = RateLimiter(
+            rate=API_RATE_LIMIT_REQUESTS / API_RATE_LIMIT_PERIOD_SECONDS,
+            capacity=API_RATE_LIMIT_REQUESTS,
+        )
         logger.info("AssemblyAI client configured", api_key_length=len(self.config.assemblyai_api_key))
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((ConnectionError, TimeoutError))
-    )
+    @cached_property
+    def _transcriber(self) -> aai.Transcriber:
+        """Transcriber shared across calls so the SDK's HTTP connections are reused."""
+        return aai.Transcriber()
+
+    def _get_transcription_config(
+        self,
+        enable_sentiment_analysis: bool,
+        with_webhook: bool = False
+    ) -> aai.TranscriptionConfig:
+        """Return the transcription settings for a request, built once per combination of flags.
+
+        Only ``submit`` asks for the webhook: the other entry points poll, and
+        callbacks for transcripts they started would be unknown to ``handle_webhook``.
+        """
+        key = (enable_sentiment_analysis, with_webhook)
+        config = self._transcription_configs.get(key)
+        if config is None:
+            config = aai.TranscriptionConfig(
+                speaker_labels=True,  # Enable speaker diarization
+                speakers_expected=None,  # Let AssemblyAI auto-detect speaker count
+                auto_highlights=True,  # Enable auto-highlights for better accuracy
+                sentiment_analysis=enable_sentiment_analysis,  # Optional sentiment analysis
+                entity_detection=False,  # Disable to focus on accuracy
+                webhook_url=self.config.webhook_url if with_webhook else None,  # Optional completion callback
+            )
+            self._transcription_configs[key] = config
+        return config
+
+    def _retry_policy(self) -> dict[str, Any]:
+        """Retry policy for individual AssemblyAI API calls."""
+        return {
+            "stop": stop_after_attempt(self.config.max_retries),
+            "wait": wait_exponential(multiplier=1, min=2, max=30),
+            "retry": retry_if_exception_type(RETRYABLE_ERRORS),
+            "reraise": True,
+        }
+
+    def _retrying(self) -> Retrying:
+        """Retry API calls, blocking the calling thread between attempts."""
+        return Retrying(**self._retry_policy())
+
+    def _async_retrying(self) -> AsyncRetrying:
+        """Retry API calls, waiting between attempts with asyncio.sleep."""
+        return AsyncRetrying(**self._retry_policy())
+
+    def _rate_limited(
+        self, requests: int, func: Callable[..., aai.Transcript], *args: Any, **kwargs: Any
+    ) -> aai.Transcript:
+        """Call ``func`` once it may make ``requests`` API requests under the rate limit."""
+        self._rate_limiter.wait(requests)
+        return func(*args, **kwargs)
+
+    async def _rate_limited_async(
+        self, requests: int, func: Callable[..., aai.Transcript], *args: Any, **kwargs: Any
+    ) -> aai.Transcript:
+        """Async ``_rate_limited``, running ``func`` in a worker thread."""
+        await self._rate_limiter.acquire(requests)
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    def _submit_with_retry(self, audio_file: str, config: aai.TranscriptionConfig) -> aai.Transcript:
+        """Upload and submit a file, retrying transient failures of the submission only."""
+        return self._retrying()(
+            self._rate_limited, SUBMIT_REQUESTS, self._transcriber.submit, audio_file, config=config
+        )
+
+    async def _submit_async(self, audio_file: str, config: aai.TranscriptionConfig) -> aai.Transcript:
+        """Async ``_submit_with_retry``, waiting between attempts without holding a thread."""
+        return await self._async_retrying()(
+            self._rate_limited_async, SUBMIT_REQUESTS, self._transcriber.submit, audio_file, config=config
+        )
+
+    def _poll_with_retry(self, transcript_id: str) -> aai.Transcript:
+        """Fetch a transcript's current state, retrying transient failures."""
+        return self._retrying()(self._rate_limited, 1, _fetch_transcript, transcript_id)
+
+    async def _poll_async(self, transcript_id: str) -> aai.Transcript:
+        """Async ``_poll_with_retry``: each attempt borrows a worker thread for one request only."""
+        return await self._async_retrying()(self._rate_limited_async, 1, _fetch_transcript, transcript_id)
+
     def transcribe_file(self, audio_file_path: Path, enable_sentiment_analysis: bool = False) -> TranscriptionResult:
         """
         Transcribe an audio file with speaker diarization.
@@ -59,9 +226,10 @@ class TranscripterService:
             TranscriptionError: If transcription fails
         """
         correlation_id = get_correlation_id()
+        audio_file = os.fspath(audio_file_path)
         logger.info(
             "Starting transcription",
-            audio_file=str(audio_file_path),
+            audio_file=audio_file,
             sentiment_analysis=enable_sentiment_analysis,
             correlation_id=correlation_id
         )
@@ -70,108 +238,455 @@ class TranscripterService:
 
         try:
             # Validate file exists
-            if not audio_file_path.exists():
-                raise TranscriptionError(f"Audio file not found: {audio_file_path}")
+            file_size = self._audio_file_size(audio_file_path)
 
-            # Create transcriber and configure for speaker diarization
-            transcriber = aai.Transcriber()
+            # Skip the API entirely for audio we've already transcribed
+            cache_path = self._cache_path(audio_file_path, enable_sentiment_analysis)
+            if cache_path is not None and (cached := self._load_cached_result(cache_path, audio_file_path)) is not None:
+                return cached
 
-            # Configure transcription settings
-            config = aai.TranscriptionConfig(
-                speaker_labels=True,  # Enable speaker diarization
-                speakers_expected=None,  # Let AssemblyAI auto-detect speaker count
-                auto_highlights=True,  # Enable auto-highlights for better accuracy
-                sentiment_analysis=enable_sentiment_analysis,  # Optional sentiment analysis
-                entity_detection=False,  # Disable to focus on accuracy
+            # Configure for speaker diarization
+            config = self._get_transcription_config(enable_sentiment_analysis)
+
+            logger.info("Starting AssemblyAI transcription", file_size=file_size)
+
+            # Submit the file and wait for completion
+            transcript = self._submit_with_retry(audio_file, config)
+            transcript = self._wait_for_completion(transcript)
+
+            result = self._completed_result(transcript, audio_file_path, start_time, enable_sentiment_analysis)
+            if cache_path is not None:
+                self._store_cached_result(cache_path, result)
+            return result
+
+        except Exception as e:
+            logger.error(
+                "Transcription failed",
+                error=str(e),
+                audio_file=audio_file,
+                correlation_id=correlation_id
             )
+            raise TranscriptionError(f"Failed to transcribe {audio_file_path}: {e}") from e
+
+    def _completed_result(
+        self,
+        transcript: aai.Transcript,
+        audio_file_path: Path,
+        start_time: float,
+        enable_sentiment_analysis: bool
+    ) -> TranscriptionResult:
+        """Turn a finished transcript into a result, raising if AssemblyAI reported an error."""
+        if transcript.status == aai.TranscriptStatus.error:
+            raise TranscriptionError(f"Transcription failed: {transcript.error}")
+
+        # Process the results
+        processing_time = int((time.time() - start_time) * 1000)
+        result = self._process_transcript(
+            transcript, audio_file_path, processing_time, sentiment_analysis_enabled=enable_sentiment_analysis
+        )
 
-            logger.info("Starting AssemblyAI transcription")
+        logger.info(
+            "Transcription completed",
+            utterances_count=len(result.utterances),
+            sentiment_results_count=len(result.sentiment_results) if result.sentiment_results else 0,
+            processing_time_ms=processing_time,
+            correlation_id=get_correlation_id()
+        )
 
-            # Transcribe the file
-            transcript = transcriber.transcribe(str(audio_file_path), config=config)
+        return result
 
-            # Wait for completion
-            while transcript.status not in [aai.TranscriptStatus.completed, aai.TranscriptStatus.error]:
-                logger.debug("Transcription in progress", status=transcript.status)
-                time.sleep(1)
-                if transcript.id is None:
-                    raise TranscriptionError("Transcript ID is None")
-                transcript = aai.Transcript.get_by_id(transcript.id)
+    def _cache_path(self, audio_file_path: Path, enable_sentiment_analysis: bool) -> Path | None:
+        """Return where the result for this audio content and settings is cached, if caching is enabled."""
+        if self.config.cache_dir is None:
+            return None
+
+        settings = f"sentiment={enable_sentiment_analysis}|".encode()
+        with open(audio_file_path, 'rb') as f:
+            digest = hashlib.file_digest(f, lambda: hashlib.blake2b(settings, digest_size=16))
+        return self.config.cache_dir / f"{digest.hexdigest()}.json"
+
+    @staticmethod
+    def _load_cached_result(cache_path: Path, audio_file_path: Path) -> TranscriptionResult | None:
+        """Load a cached result, or None if there isn't a usable one."""
+        try:
+            result = TranscriptionResult.model_validate_json(cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except ValidationError as e:
+            logger.warning("Ignoring unreadable cached transcript", cache_path=str(cache_path), error=str(e))
+            return None
+
+        logger.info("Using cached transcription", cache_path=str(cache_path))
+        return result.model_copy(update={"audio_file": audio_file_path})
+
+    @staticmethod
+    def _store_cached_result(cache_path: Path, result: TranscriptionResult) -> None:
+        """Cache a result, writing it atomically so readers never see a partial file."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(result.model_dump_json(), encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            # The transcription itself succeeded; don't fail it over the cache
+            logger.warning("Failed to cache transcript", cache_path=str(cache_path), error=str(e))
+
+    @staticmethod
+    def _audio_file_size(audio_file_path: Path) -> int:
+        """Return the audio file's size, checking that it exists with one stat call."""
+        try:
+            return audio_file_path.stat().st_size
+        except FileNotFoundError as e:
+            raise TranscriptionError(f"Audio file not found: {audio_file_path}") from e
+
+    def submit(self, audio_file_path: Path, enable_sentiment_analysis: bool = False) -> str:
+        """
+        Submit an audio file for transcription without waiting for the result.
+
+        Args:
+            audio_file_path: Path to the audio file to transcribe
+            enable_sentiment_analysis: Enable sentiment analysis for each sentence
+
+        Returns:
+            The transcript ID to pass to ``await_result``
+
+        Raises:
+            TranscriptionError: If the file is missing or the submission fails
+        """
+        audio_file = os.fspath(audio_file_path)
+        file_size = self._audio_file_size(audio_file_path)
+
+        submitted_at = time.time()
+        try:
+            config = self._get_transcription_config(enable_sentiment_analysis, with_webhook=True)
+            transcript = self._submit_with_retry(audio_file, config)
+        except Exception as e:
+            raise TranscriptionError(f"Failed to submit {audio_file_path}: {e}") from e
+        if transcript.id is None:
+            raise TranscriptionError("Transcript ID is None")
+
+        self._pending[transcript.id] = _PendingTranscript(audio_file_path, enable_sentiment_analysis, submitted_at)
+        logger.info("Transcription submitted", transcript_id=transcript.id, audio_file=audio_file, file_size=file_size)
+        return transcript.id
+
+    def handle_webhook(self, payload: Mapping[str, Any]) -> bool:
+        """
+        Resolve a submitted transcript from an AssemblyAI webhook request body.
+
+        Call this from the HTTP handler serving ``webhook_url``.
+
+        Args:
+            payload: Decoded JSON body, with ``transcript_id`` and ``status``
+
+        Returns:
+            True if the payload matched a transcript awaiting its result
+        """
+        transcript_id = payload.get("transcript_id")
+        pending = self._pending.get(transcript_id) if isinstance(transcript_id, str) else None
+        if pending is None:
+            logger.warning("Webhook for unknown transcript", transcript_id=transcript_id)
+            return False
+
+        if not pending.webhook_status.done():
+            pending.webhook_status.set_result(str(payload.get("status")))
+        return True
+
+    def await_result(self, transcript_id: str) -> TranscriptionResult:
+        """
+        Wait for a transcript started with ``submit`` and return its result.
+
+        With ``webhook_url`` configured this waits for ``handle_webhook`` to be
+        called for the transcript instead of polling the API, only checking the
+        transcript itself every ``WEBHOOK_CHECK_INTERVAL`` seconds in case the
+        callback was missed.
+
+        Raises:
+            TranscriptionError: If the transcript is unknown, fails or times out
+        """
+        pending = self._pending.get(transcript_id)
+        if pending is None:
+            raise TranscriptionError(f"Unknown transcript ID: {transcript_id}")
+
+        try:
+            if self.config.webhook_url:
+                transcript = self._wait_for_webhook(transcript_id, pending)
+            else:
+                transcript = self._wait_for_completion(self._poll_with_retry(transcript_id))
 
             if transcript.status == aai.TranscriptStatus.error:
                 raise TranscriptionError(f"Transcription failed: {transcript.error}")
 
-            # Process the results
-            processing_time = int((time.time() - start_time) * 1000)
-            result = self._process_transcript(transcript, audio_file_path, processing_time, enable_sentiment_analysis)
-
-            logger.info(
-                "Transcription completed",
-                utterances_count=len(result.utterances),
-                sentiment_results_count=len(result.sentiment_results) if result.sentiment_results else 0,
-                processing_time_ms=processing_time,
-                correlation_id=correlation_id
+            processing_time = int((time.time() - pending.submitted_at) * 1000)
+            return self._process_transcript(
+                transcript,
+                pending.audio_file_path,
+                processing_time,
+                sentiment_analysis_enabled=pending.enable_sentiment_analysis,
             )
+        finally:
+            self._pending.pop(transcript_id, None)
+
+    def _wait_for_webhook(self, transcript_id: str, pending: _PendingTranscript) -> aai.Transcript:
+        """Wait for a submitted transcript's webhook, then fetch the transcript.
+
+        Every ``WEBHOOK_CHECK_INTERVAL`` without a callback the transcript is
+        polled once, so a missed callback doesn't leave the caller waiting
+        forever. Gives up after ``max_poll_seconds`` unless that is negative.
+        """
+        deadline = None
+        if self.config.max_poll_seconds >= 0:
+            deadline = time.monotonic() + self.config.max_poll_seconds
+
+        while True:
+            wait = WEBHOOK_CHECK_INTERVAL
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    raise TranscriptionError(
+                        f"Timed out after {self.config.max_poll_seconds}s waiting for webhook "
+                        f"for transcript {transcript_id}"
+                    )
+
+            try:
+                pending.webhook_status.result(timeout=wait)
+            except TimeoutError:
+                # A single status request; the deadline is re-checked before the next wait
+                transcript = self._poll_with_retry(transcript_id)
+                if transcript.status in TERMINAL_STATUSES:
+                    logger.info("Transcript finished without a webhook", transcript_id=transcript_id)
+                    return transcript
+                continue
+
+            return self._poll_with_retry(transcript_id)
+
+    async def transcribe_file_async(
+        self,
+        audio_file_path: Path,
+        enable_sentiment_analysis: bool = False
+    ) -> TranscriptionResult:
+        """Transcribe an audio file without blocking the event loop.
+
+        The upload runs in a worker thread; waiting for the transcript then
+        polls asynchronously, so no thread is held while AssemblyAI works.
+        """
+        audio_file = os.fspath(audio_file_path)
+        logger.info("Starting transcription", audio_file=audio_file, sentiment_analysis=enable_sentiment_analysis)
+
+        start_time = time.time()
+
+        try:
+            file_size = self._audio_file_size(audio_file_path)
+
+            cache_path = await asyncio.to_thread(self._cache_path, audio_file_path, enable_sentiment_analysis)
+            if cache_path is not None and (cached := self._load_cached_result(cache_path, audio_file_path)) is not None:
+                return cached
+
+            config = self._get_transcription_config(enable_sentiment_analysis)
+
+            logger.info("Starting AssemblyAI transcription", file_size=file_size)
+            transcript = await self._submit_async(audio_file, config)
+            if transcript.status not in TERMINAL_STATUSES:
+                if transcript.id is None:
+                    raise TranscriptionError("Transcript ID is None")
+                transcript = await self._await_completion(transcript.id)
 
+            result = self._completed_result(transcript, audio_file_path, start_time, enable_sentiment_analysis)
+            if cache_path is not None:
+                self._store_cached_result(cache_path, result)
             return result
 
         except Exception as e:
-            logger.error(
-                "Transcription failed",
-                error=str(e),
-                audio_file=str(audio_file_path),
-                correlation_id=correlation_id
-            )
+            logger.error("Transcription failed", error=str(e), audio_file=audio_file)
             raise TranscriptionError(f"Failed to transcribe {audio_file_path}: {e}") from e
 
+    async def transcribe_files(
+        self,
+        audio_file_paths: Iterable[Path],
+        enable_sentiment_analysis: bool = False,
+        max_concurrent: int | None = None
+    ) -> list[TranscriptionResult | BaseException]:
+        """
+        Transcribe several audio files concurrently.
+
+        Args:
+            audio_file_paths: Paths to the audio files to transcribe
+            enable_sentiment_analysis: Enable sentiment analysis for each sentence
+            max_concurrent: Maximum number of transcriptions in flight at once
+                (default: ``max_concurrent_transcriptions`` from the config)
+
+        Returns:
+            One entry per input file, in order: the TranscriptionResult, or the
+            exception that file failed with so other files still complete
+        """
+        semaphore = asyncio.Semaphore(max_concurrent or self.config.max_concurrent_transcriptions)
+
+        async def transcribe_one(audio_file_path: Path) -> TranscriptionResult:
+            async with semaphore:
+                return await self.transcribe_file_async(audio_file_path, enable_sentiment_analysis)
+
+        return await asyncio.gather(
+            *(transcribe_one(path) for path in audio_file_paths),
+            return_exceptions=True,
+        )
+
+    async def transcribe_file_parallel(
+        self,
+        audio_file_path: Path,
+        enable_sentiment_analysis: bool = False,
+        chunk_seconds: float = 300.0,
+        max_concurrent: int | None = None
+    ) -> TranscriptionResult:
+        """
+        Transcribe a long audio file as concurrently transcribed chunks.
+
+        The file is split on silences into pieces of roughly ``chunk_seconds``
+        with ffmpeg, and the pieces' results are stitched back together with
+        timestamps and speaker labels on the original timeline.
+
+        Args:
+            audio_file_path: Path to the audio file to transcribe
+            enable_sentiment_analysis: Enable sentiment analysis for each sentence
+            chunk_seconds: Target length of each chunk
+            max_concurrent: Maximum number of chunks in flight at once
+                (default: ``max_concurrent_transcriptions`` from the config)
+
+        Raises:
+            TranscriptionError: If ffmpeg is unavailable or any chunk fails
+        """
+        if shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None:
+            raise TranscriptionError("ffmpeg and ffprobe are required to split audio files")
+
+        start_time = time.time()
+        with tempfile.TemporaryDirectory(prefix="transcripter-") as chunk_dir:
+            try:
+                chunks = await asyncio.to_thread(split_audio, audio_file_path, Path(chunk_dir), chunk_seconds)
+            except (OSError, ValueError, subprocess.CalledProcessError) as e:
+                raise TranscriptionError(f"Failed to split {audio_file_path}: {e}") from e
+
+            if len(chunks) == 1:
+                return await self.transcribe_file_async(audio_file_path, enable_sentiment_analysis)
+
+            logger.info("Transcribing audio in chunks", audio_file=str(audio_file_path), chunks=len(chunks))
+            results = await self.transcribe_files([c.path for c in chunks], enable_sentiment_analysis, max_concurrent)
+
+        transcribed = [r for r in results if isinstance(r, TranscriptionResult)]
+        if len(transcribed) < len(results):
+            failure = next(r for r in results if not isinstance(r, TranscriptionResult))
+            raise TranscriptionError(
+                f"Failed to transcribe {len(results) - len(transcribed)} of {len(chunks)} chunks "
+                f"of {audio_file_path}: {failure}"
+            ) from failure
+
+        processing_time = int((time.time() - start_time) * 1000)
+        return stitch_results(chunks, transcribed, audio_file_path, processing_time)
+
+    def _wait_for_completion(self, transcript: aai.Transcript) -> aai.Transcript:
+        """Poll a submitted transcript with exponential backoff until it finishes.
+
+        Gives up after ``max_poll_seconds`` unless that is negative.
+        """
+        deadline = None
+        if self.config.max_poll_seconds >= 0:
+            deadline = time.monotonic() + self.config.max_poll_seconds
+
+        log_progress = logger.is_enabled_for(logging.DEBUG)
+        started = time.monotonic()
+        delay = POLL_INITIAL_DELAY
+        polls = 0
+        while transcript.status not in TERMINAL_STATUSES:
+            if transcript.id is None:
+                raise TranscriptionError("Transcript ID is None")
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise TranscriptionError(
+                    f"Timed out after {self.config.max_poll_seconds}s waiting for transcript {transcript.id}"
+                )
+
+            if log_progress and polls % POLL_LOG_EVERY == 0:
+                logger.debug(
+                    "Transcription in progress",
+                    status=transcript.status,
+                    polls=polls,
+                    elapsed_s=round(time.monotonic() - started, 1),
+                )
+            polls += 1
+            time.sleep(delay)
+            delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+            transcript = self._poll_with_retry(transcript.id)
+
+        return transcript
+
+    async def _await_completion(self, transcript_id: str) -> aai.Transcript:
+        """Async counterpart of ``_wait_for_completion``, sleeping without holding a thread.
+
+        Gives up after ``max_poll_seconds`` unless that is negative.
+        """
+        log_progress = logger.is_enabled_for(logging.DEBUG)
+        started = time.monotonic()
+
+        async def poll() -> aai.Transcript:
+            delay = POLL_INITIAL_DELAY
+            polls = 0
+            while True:
+                if log_progress and polls % POLL_LOG_EVERY == 0:
+                    logger.debug(
+                        "Transcription in progress",
+                        transcript_id=transcript_id,
+                        polls=polls,
+                        elapsed_s=round(time.monotonic() - started, 1),
+                    )
+                polls += 1
+                await asyncio.sleep(delay)
+                transcript = await self._poll_async(transcript_id)
+                if transcript.status in TERMINAL_STATUSES:
+                    return transcript
+                delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+
+        timeout = self.config.max_poll_seconds if self.config.max_poll_seconds >= 0 else None
+        try:
+            return await asyncio.wait_for(poll(), timeout)
+        except TimeoutError as e:
+            raise TranscriptionError(
+                f"Timed out after {self.config.max_poll_seconds}s waiting for transcript {transcript_id}"
+            ) from e
+
     def _process_transcript(
         self,
         transcript: aai.Transcript,
         audio_file_path: Path,
         processing_time_ms: int,
+        *,
         sentiment_analysis_enabled: bool = False
     ) -> TranscriptionResult:
         """Process AssemblyAI transcript into our format."""
-        utterances = []
-
         # Process utterances with speaker labels
-        if hasattr(transcript, 'utterances') and transcript.utterances:
-            for utterance in transcript.utterances:
-                speaker_utterance = SpeakerUtterance(
-                    speaker=utterance.speaker or "Unknown",
-                    text=utterance.text,
-                    start=utterance.start,
-                    end=utterance.end,
-                    confidence=getattr(utterance, 'confidence', None)
-                )
-                utterances.append(speaker_utterance)
-        else:
+        utterances = [
+            SpeakerUtterance(
+                speaker=utterance.speaker or "Unknown",
+                text=utterance.text,
+                start=utterance.start,
+                end=utterance.end,
+                confidence=utterance.confidence
+            )
+            for utterance in transcript.utterances or []
+        ]
+        if not utterances:
             # Fallback: treat entire transcript as single speaker
             logger.warning("No speaker utterances found, treating as single speaker")
             if transcript.text:
-                speaker_utterance = SpeakerUtterance(
+                utterances.append(SpeakerUtterance(
                     speaker="A",
                     text=transcript.text,
                     start=0,
                     end=transcript.audio_duration or 0,
-                    confidence=getattr(transcript, 'confidence', None)
-                )
-                utterances.append(speaker_utterance)
+                    confidence=transcript.confidence
+                ))
 
         # Process sentiment analysis results if available
         sentiment_results = None
-        if sentiment_analysis_enabled and hasattr(transcript, 'sentiment_analysis') and transcript.sentiment_analysis:
-            sentiment_results = []
-            for sentiment in transcript.sentiment_analysis:
-                sentiment_result = SentimentResult(
-                    text=sentiment.text,
-                    sentiment=sentiment.sentiment,  # type: ignore[arg-type]
-                    confidence=sentiment.confidence,
-                    start=sentiment.start,
-                    end=sentiment.end,
-                    speaker=getattr(sentiment, 'speaker', None)
-                )
-                sentiment_results.append(sentiment_result)
+        if sentiment_analysis_enabled and transcript.sentiment_analysis:
+            sentiment_results = SENTIMENT_RESULTS_ADAPTER.validate_python(
+                transcript.sentiment_analysis, from_attributes=True
+            )
             logger.info("Processed sentiment analysis results", count=len(sentiment_results))
 
         return TranscriptionResult(
@@ -194,21 +709,48 @@ class TranscripterService:
         Args:
             result: TranscriptionResult to save
             output_path: Path to save the transcript
-            format: Output format ("txt" or "srt")
+            format: Output format ("txt", "srt" or "jsonl")
+
+        Raises:
+            ValueError: If the format isn't supported
         """
         logger.info("Saving transcript", output_path=str(output_path), format=format)
 
+        output_format = format.lower()
+        if output_format not in TRANSCRIPT_WRITERS and output_format not in BINARY_TRANSCRIPT_WRITERS:
+            raise ValueError(f"Unsupported output format: {format}")
+
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate content based on format
-        if format.lower() == "srt":
-            content = result.to_srt_format()
+        # Stream content based on format rather than building it in memory
+        if output_format in BINARY_TRANSCRIPT_WRITERS:
+            with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.writelines(BINARY_TRANSCRIPT_WRITERS[output_format](result))
         else:
-            content = result.to_transcript_text()
+            with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                f.writelines(TRANSCRIPT_WRITERS[output_format](result))
 
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        logger.info("Transcript saved", output_path=str(output_path), utterances=len(result.utterances))
 
-        logger.info("Transcript saved", output_path=str(output_path), content_length=len(content))
+    async def save_transcript_async(
+        self,
+        result: TranscriptionResult,
+        output_path: Path,
+        format: str = "txt"
+    ) -> None:
+        """
+        Save a transcription result without blocking the event loop.
+
+        Runs ``save_transcript`` in a worker thread, so a batch of saves
+        gathered together overlap their disk I/O.
+
+        Args:
+            result: TranscriptionResult to save
+            output_path: Path to save the transcript
+            format: Output format ("txt", "srt" or "jsonl")
+
+        Raises:
+            ValueError: If the format isn't supported
+        """
+        await asyncio.to_thread(self.save_transcript, result, output_path, format)
@@ -0,0 +1,52 @@
+"""Shared test fixtures."""
+
+from pathlib import Path
+from unittest.mock import create_autospec
+
+import pytest
+import structlog
+
+from transcripter.config import TranscripterConfig, correlation_id
+from transcripter.models import SpeakerUtterance, TranscriptionResult
+from transcripter.transcription_service import TranscripterService
+
+
+@pytest.fixture(autouse=True)
+def _isolate_correlation_id():
+    """Start each test without a correlation ID and drop any it sets, so none leak between tests."""
+    token = correlation_id.set("")
+    yield
+    correlation_id.reset(token)
+    structlog.contextvars.unbind_contextvars("correlation_id")
+
+
+@pytest.fixture(scope="session")
+def transcripter_config(tmp_path_factory):
+    """Configuration loaded and validated once per test session."""
+    return TranscripterConfig(assemblyai_api_key="test_key", output_dir=tmp_path_factory.mktemp("output"))
+
+
+@pytest.fixture(scope="session")
+def sample_result():
+    """A one-utterance result, validated once per session; results are frozen, so tests can share it."""
+    return TranscriptionResult(
+        utterances=[SpeakerUtterance(speaker="A", text="Hello world", start=1000, end=3000)],
+        audio_file=Path("test.mp3")
+    )
+
+
+@pytest.fixture(scope="session")
+def _service_template():
+    """Autospec'd TranscripterService mock, built once per test session."""
+    return create_autospec(TranscripterService, instance=True)
+
+
+@pytest.fixture
+def mock_service(_service_template):
+    """The shared TranscripterService mock, with calls and configured returns cleared.
+
+    Resetting rather than copying: a shallow copy of a mock shares its child
+    mocks, so calls recorded in one test would leak into the next.
+    """
+    _service_template.reset_mock(return_value=True, side_effect=True)
+    return _service_template
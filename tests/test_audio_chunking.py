@@ -0,0 +1,227 @@
+"""Tests for splitting audio into chunks and stitching results."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from transcripter.audio_chunking import (
+    CHUNK_OVERLAP_SECONDS,
+    AudioChunk,
+    parse_silences,
+    plan_cut_points,
+    split_audio,
+    stitch_results,
+)
+from transcripter.models import SentimentResult, SpeakerUtterance, TranscriptionResult
+
+
+def _utterance(speaker, start, end, text="text"):
+    return SpeakerUtterance(speaker=speaker, text=text, start=start, end=end)
+
+
+class TestSilenceDetection:
+    """Test parsing ffmpeg silencedetect output."""
+
+    def test_parse_silences(self):
+        """Test that start/end lines are paired and other output ignored."""
+        output = (
+            "Input #0, mp3, from 'a.mp3':\n"
+            "[silencedetect @ 0x1] silence_start: 12.5\n"
+            "[silencedetect @ 0x1] silence_end: 13.25 | silence_duration: 0.75\n"
+            "[silencedetect @ 0x1] silence_start: 40\n"
+            "[silencedetect @ 0x1] silence_end: 41.5 | silence_duration: 1.5\n"
+            "[silencedetect @ 0x1] silence_start: 99.0\n"
+        )
+
+        assert parse_silences(output) == [(12.5, 13.25), (40.0, 41.5)]
+
+
+class TestPlanCutPoints:
+    """Test choosing where to split audio."""
+
+    def test_short_audio_not_split(self):
+        """Test that audio within one chunk length isn't cut."""
+        assert plan_cut_points(250.0, [(100.0, 101.0)], 300.0) == []
+
+    def test_cuts_at_silence_nearest_target(self):
+        """Test that cuts land in the middle of the closest silence."""
+        silences = [(200.0, 202.0), (290.0, 292.0), (590.0, 600.0)]
+
+        assert plan_cut_points(700.0, silences, 300.0) == [291.0, 595.0]
+
+    def test_falls_back_to_target_without_silence(self):
+        """Test that audio with no usable silence is cut at the target length."""
+        assert plan_cut_points(700.0, [], 300.0) == [300.0, 600.0]
+
+    def test_avoids_tiny_last_chunk(self):
+        """Test that a cut leaving less than the overlap at the end is dropped."""
+        assert plan_cut_points(300.0 + CHUNK_OVERLAP_SECONDS / 2, [], 300.0) == []
+
+    @pytest.mark.parametrize("target_chunk_s", [0.0, -60.0])
+    def test_non_positive_chunk_length_rejected(self, target_chunk_s):
+        """Test that a chunk length that would never advance is rejected instead of looping."""
+        with pytest.raises(ValueError, match="must be positive"):
+            plan_cut_points(100.0, [], target_chunk_s)
+
+
+class TestSplitAudio:
+    """Test splitting files with ffmpeg."""
+
+    @patch('transcripter.audio_chunking.subprocess.run')
+    @patch('transcripter.audio_chunking.detect_silences', return_value=[])
+    @patch('transcripter.audio_chunking.audio_duration_seconds', return_value=100.0)
+    def test_short_file_returned_whole(self, mock_duration, mock_silences, mock_run):
+        """Test that unsplit audio points at the original file without re-encoding."""
+        chunks = split_audio(Path("a.mp3"), Path("/tmp"), 300.0)
+
+        assert chunks == [AudioChunk(Path("a.mp3"), 0, 0, None)]
+        mock_run.assert_not_called()
+
+    @patch('transcripter.audio_chunking.subprocess.run')
+    @patch('transcripter.audio_chunking.detect_silences', return_value=[])
+    @patch('transcripter.audio_chunking.audio_duration_seconds', return_value=700.0)
+    def test_chunks_overlap_both_sides_of_cut(self, mock_duration, mock_silences, mock_run, tmp_path):
+        """Test that chunks extend past their cuts on both sides and own the audio between them."""
+        chunks = split_audio(Path("a.mp3"), tmp_path, 300.0)
+
+        assert [(c.offset_ms, c.keep_from_ms, c.keep_until_ms) for c in chunks] == [
+            (0, 0, 300_000),
+            (285_000, 300_000, 600_000),
+            (585_000, 600_000, None),
+        ]
+        lengths = [c.args[0][c.args[0].index("-t") + 1] for c in mock_run.call_args_list]
+        assert lengths == ["315.000", "330.000", "115.000"]
+        assert all(c.path.parent == tmp_path for c in chunks)
+
+
+class TestStitchResults:
+    """Test merging chunk results."""
+
+    def test_offsets_and_overlap_deduplicated(self):
+        """Test that timestamps move to the original timeline and overlap is kept once."""
+        chunks = [
+            AudioChunk(Path("c0.flac"), 0, 0, 300_000),
+            AudioChunk(Path("c1.flac"), 285_000, 300_000, None),
+        ]
+        results = [
+            TranscriptionResult(audio_file=Path("c0.flac"), utterances=[
+                _utterance("A", 0, 290_000, "first"),
+                _utterance("B", 290_000, 299_000, "overlap"),
+            ]),
+            TranscriptionResult(audio_file=Path("c1.flac"), total_duration=100, utterances=[
+                _utterance("A", 5_000, 14_000, "overlap"),
+                _utterance("A", 15_000, 30_000, "second"),
+            ]),
+        ]
+
+        stitched = stitch_results(chunks, results, Path("a.mp3"), processing_time_ms=42)
+
+        assert [(u.speaker, u.text, u.start, u.end) for u in stitched.utterances] == [
+            ("A", "first", 0, 290_000),
+            ("B", "overlap", 290_000, 299_000),
+            ("B", "second", 300_000, 315_000),
+        ]
+        assert stitched.audio_file == Path("a.mp3")
+        assert stitched.total_duration == 385
+        assert stitched.processing_time_ms == 42
+
+    def test_utterance_across_cut_kept_whole(self):
+        """Test that an utterance running across a cut comes whole from the chunk it starts in."""
+        chunks = [
+            AudioChunk(Path("c0.flac"), 0, 0, 300_000),
+            AudioChunk(Path("c1.flac"), 285_000, 300_000, None),
+        ]
+        results = [
+            TranscriptionResult(audio_file=Path("c0.flac"), utterances=[
+                _utterance("A", 0, 290_000, "first"),
+                _utterance("B", 295_000, 310_000, "across the cut"),
+                _utterance("A", 311_000, 314_000, "trailing overlap"),
+            ]),
+            TranscriptionResult(audio_file=Path("c1.flac"), utterances=[
+                _utterance("B", 10_000, 25_000, "across the cut"),
+                _utterance("A", 26_000, 40_000, "second"),
+            ]),
+        ]
+
+        stitched = stitch_results(chunks, results, Path("a.mp3"))
+
+        assert [(u.speaker, u.text, u.start, u.end) for u in stitched.utterances] == [
+            ("A", "first", 0, 290_000),
+            ("B", "across the cut", 295_000, 310_000),
+            ("A", "second", 311_000, 325_000),
+        ]
+
+    def test_unmatched_speakers_get_new_labels(self):
+        """Test that speakers only heard after a cut don't reuse an existing label."""
+        chunks = [
+            AudioChunk(Path("c0.flac"), 0, 0, 300_000),
+            AudioChunk(Path("c1.flac"), 285_000, 300_000, None),
+        ]
+        results = [
+            TranscriptionResult(audio_file=Path("c0.flac"), utterances=[
+                _utterance("A", 0, 299_000),
+            ]),
+            TranscriptionResult(audio_file=Path("c1.flac"), utterances=[
+                _utterance("B", 0, 14_000),
+                _utterance("A", 20_000, 30_000),
+            ]),
+        ]
+
+        stitched = stitch_results(chunks, results, Path("a.mp3"))
+
+        assert [u.speaker for u in stitched.utterances] == ["A", "B"]
+
+    def test_sentiment_results_remapped(self):
+        """Test that sentiment results get the same offsets and speaker labels."""
+        chunks = [
+            AudioChunk(Path("c0.flac"), 0, 0, 300_000),
+            AudioChunk(Path("c1.flac"), 285_000, 300_000, None),
+        ]
+        results = [
+            TranscriptionResult(
+                audio_file=Path("c0.flac"),
+                utterances=[_utterance("A", 0, 299_000)],
+                sentiment_results=[],
+            ),
+            TranscriptionResult(
+                audio_file=Path("c1.flac"),
+                utterances=[_utterance("B", 0, 30_000)],
+                sentiment_results=[SentimentResult(
+                    text="later", sentiment="POSITIVE", confidence=0.9, start=20_000, end=25_000, speaker="B"
+                )],
+            ),
+        ]
+
+        stitched = stitch_results(chunks, results, Path("a.mp3"))
+
+        assert stitched.sentiment_results is not None
+        assert [(s.speaker, s.start) for s in stitched.sentiment_results] == [("A", 305_000)]
+
+    def test_unmatched_sentiment_speakers_get_new_labels(self):
+        """Test that a sentiment speaker with no utterances in its chunk doesn't keep a colliding raw label."""
+        chunks = [
+            AudioChunk(Path("c0.flac"), 0, 0, 300_000),
+            AudioChunk(Path("c1.flac"), 285_000, 300_000, None),
+        ]
+        results = [
+            TranscriptionResult(
+                audio_file=Path("c0.flac"),
+                utterances=[_utterance("A", 0, 100_000), _utterance("B", 100_000, 299_000)],
+                sentiment_results=[],
+            ),
+            TranscriptionResult(
+                audio_file=Path("c1.flac"),
+                utterances=[_utterance("A", 0, 14_000), _utterance("A", 20_000, 30_000)],
+                sentiment_results=[SentimentResult(
+                    text="later", sentiment="NEUTRAL", confidence=0.8, start=20_000, end=25_000, speaker="B"
+                )],
+            ),
+        ]
+
+        stitched = stitch_results(chunks, results, Path("a.mp3"))
+
+        assert stitched.sentiment_results is not None
+        # Chunk 1's "A" continues chunk 0's "B", so its own "B" must not stay "B"
+        assert [u.speaker for u in stitched.utterances] == ["A", "B", "B"]
+        assert [s.speaker for s in stitched.sentiment_results] == ["C"]
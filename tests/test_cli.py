@@ -1,278 +1,255 @@
 """Tests for the CLI functionality."""
 
+import builtins
+import subprocess
+import sys
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
 
-from transcripter.cli import main, path_with_quote_stripping, strip_outer_quotes
+import pytest
+
+import transcripter.cli as cli_module
+import transcripter.config as config_module
+import transcripter.logging as logging_module
+import transcripter.speaker_naming_service as naming_module
+import transcripter.transcription_service as service_module
+from transcripter.cli import (
+    create_parser,
+    main,
+    path_with_quote_stripping,
+    strip_outer_quotes,
+    validate_inputs,
+)
+from transcripter.models import SentimentResult, SpeakerUtterance, TranscriptionResult
+
+_UTT_A = SpeakerUtterance(speaker="A", text="Hello", start=0, end=1000)
+_UTT_B = SpeakerUtterance(speaker="B", text="Hi", start=1000, end=2000)
+
+_RESULT_SINGLE = TranscriptionResult(
+    utterances=[_UTT_A], total_duration=5, processing_time_ms=3000, audio_file=Path("test_audio.mp3")
+)
+_RESULT_MULTI = TranscriptionResult(
+    utterances=[_UTT_A, _UTT_B], total_duration=5, processing_time_ms=3000, audio_file=Path("test_audio.mp3")
+)
+_RESULT_WITH_SENTIMENT = TranscriptionResult(
+    utterances=[_UTT_A, _UTT_B, _UTT_A],
+    total_duration=90,
+    processing_time_ms=3000,
+    audio_file=Path("test_audio.mp3"),
+    sentiment_results=[
+        SentimentResult(text="Hello", sentiment=sentiment, confidence=0.9, start=0, end=1000)
+        for sentiment in ("POSITIVE", "POSITIVE", "NEGATIVE")
+    ],
+)
 
 
 class TestCLI:
     """Test cases for CLI functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.test_input_file = Path("test_audio.mp3")
-        self.test_output_file = Path("test_output.txt")
-
-    @patch('transcripter.cli.TranscripterService')
-    @patch('transcripter.cli.get_config')
-    @patch('transcripter.cli.configure_logging')
-    @patch('builtins.input')
-    @patch('builtins.open', mock_open(read_data=""))
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    @patch('sys.argv', ['transcripter', 'test_audio.mp3', 'test_output.txt'])
-    def test_cli_with_speaker_naming_prompt_yes(self, mock_is_file, mock_exists, mock_input, mock_logging, mock_config, mock_service_class):
-        """Test CLI with speaker naming prompt - user chooses yes."""
-        # Set up mocks
-        mock_exists.return_value = True
-        mock_is_file.return_value = True
-        mock_config.return_value.output_dir = Path("output")
-        mock_service = MagicMock()
-        mock_service_class.return_value = mock_service
-
-        # Mock transcription result with multiple speakers
-        mock_result = MagicMock()
-        mock_utterance_a = MagicMock()
-        mock_utterance_a.speaker = "Speaker A"
-        mock_utterance_b = MagicMock()
-        mock_utterance_b.speaker = "Speaker B"
-        mock_result.utterances = [mock_utterance_a, mock_utterance_b]
-        mock_result.total_duration = 5
-        mock_result.processing_time_ms = 3000
-        mock_service.transcribe_file.return_value = mock_result
-
-        # Mock user input for initial prompt
-        mock_input.return_value = "y"
-
-        # Mock the SpeakerNamingService
-        with patch('transcripter.cli.SpeakerNamingService') as mock_naming_service_class:
-            mock_naming_service = MagicMock()
-            mock_naming_service_class.return_value = mock_naming_service
-            mock_naming_service.run_interactive_naming.return_value = True
-
-            # Run the CLI
-            with patch('sys.exit') as mock_exit:
-                main()
-                mock_exit.assert_not_called()  # Should not exit with error
-
-        # Verify the initial prompt was shown
-        mock_input.assert_called_with("Would you like to name the speakers? [Y/n]: ")
-
-    @patch('transcripter.cli.TranscripterService')
-    @patch('transcripter.cli.get_config')
-    @patch('transcripter.cli.configure_logging')
-    @patch('builtins.input')
-    @patch('builtins.open', mock_open(read_data=""))
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    @patch('sys.argv', ['transcripter', 'test_audio.mp3', 'test_output.txt'])
-    def test_cli_with_speaker_naming_prompt_no(self, mock_is_file, mock_exists, mock_input, mock_logging, mock_config, mock_service_class):
-        """Test CLI with speaker naming prompt - user chooses no."""
-        # Set up mocks
-        mock_exists.return_value = True
-        mock_is_file.return_value = True
-        mock_config.return_value.output_dir = Path("output")
-        mock_service = MagicMock()
-        mock_service_class.return_value = mock_service
-
-        # Mock transcription result with multiple speakers
-        mock_result = MagicMock()
-        mock_utterance_a = MagicMock()
-        mock_utterance_a.speaker = "Speaker A"
-        mock_utterance_b = MagicMock()
-        mock_utterance_b.speaker = "Speaker B"
-        mock_result.utterances = [mock_utterance_a, mock_utterance_b]
-        mock_result.total_duration = 5
-        mock_result.processing_time_ms = 3000
-        mock_service.transcribe_file.return_value = mock_result
-
-        # Mock user input for initial prompt
-        mock_input.return_value = "n"
-
-        # Run the CLI
-        with patch('sys.exit') as mock_exit:
+    @pytest.fixture(autouse=True)
+    def _cli_dependencies(self, monkeypatch, mock_service, transcripter_config):
+        """Point the CLI at the session's shared config and service mock."""
+        monkeypatch.setattr(config_module, "get_config", lambda: transcripter_config)
+        monkeypatch.setattr(logging_module, "configure_logging", lambda log_level: None)
+        monkeypatch.setattr(service_module, "TranscripterService", lambda config: mock_service)
+
+    def _run_main(self, monkeypatch, tmp_path, mock_service, result, answer, *extra_args):
+        """Run the CLI on a fake service, returning the prompts shown and transcripts opened for naming."""
+        audio_file = tmp_path / "test_audio.mp3"
+        audio_file.write_bytes(b"")
+        prompts = []
+        named = []
+
+        class FakeNamingService:
+            def __init__(self, transcript_path):
+                named.append(transcript_path)
+
+            def run_interactive_naming(self):
+                return True
+
+        monkeypatch.setattr(sys, "argv", ["transcripter", str(audio_file), str(tmp_path / "out.txt"), *extra_args])
+        mock_service.transcribe_file.return_value = result
+        monkeypatch.setattr(naming_module, "SpeakerNamingService", FakeNamingService)
+        monkeypatch.setattr(builtins, "input", lambda prompt: prompts.append(prompt) or answer)
+
+        main()
+
+        return prompts, named
+
+    @pytest.mark.parametrize(
+        ("result", "answer", "expected_prompt", "names_speakers"),
+        [
+            (_RESULT_MULTI, "y", "Would you like to name the speakers? [Y/n]: ", True),
+            (_RESULT_MULTI, "n", "Would you like to name the speakers? [Y/n]: ", False),
+            (_RESULT_SINGLE, "y", "Would you like to name the speaker? [Y/n]: ", True),
+            (_RESULT_SINGLE, "n", "Would you like to name the speaker? [Y/n]: ", False),
+        ],
+        ids=["multi-yes", "multi-no", "single-yes", "single-no"],
+    )
+    def test_cli_speaker_naming_prompt(
+        self, monkeypatch, tmp_path, mock_service, result, answer, expected_prompt, names_speakers
+    ):
+        """Test the speaker naming prompt for one or several speakers and either answer."""
+        prompts, named = self._run_main(monkeypatch, tmp_path, mock_service, result, answer)
+
+        assert prompts[-1] == expected_prompt
+        assert named == ([tmp_path / "out.txt"] if names_speakers else [])
+        mock_service.save_transcript.assert_called_once_with(result, tmp_path / "out.txt", "txt")
+
+    def test_cli_summary_with_sentiment(self, monkeypatch, tmp_path, mock_service, capsys):
+        """Test the summary printed after a transcription with sentiment analysis."""
+        self._run_main(monkeypatch, tmp_path, mock_service, _RESULT_WITH_SENTIMENT, "n", "--sentiment")
+
+        out = capsys.readouterr().out
+        assert (
+            "\nTranscription completed successfully!\n"
+            "Speakers detected: 2\n"
+            "Total utterances: 3\n"
+            "Audio duration: 90 seconds (1.50 minutes)\n"
+            "Processing time: 3000ms\n"
+            "\nSentiment Analysis:\n"
+            "  Total sentences analyzed: 3\n"
+            "  POSITIVE: 2\n"
+            "  NEUTRAL: 0\n"
+            "  NEGATIVE: 1\n"
+        ) in out
+
+    def test_cli_chunk_minutes_transcribes_in_parallel(self, monkeypatch, tmp_path, mock_service):
+        """Test that --chunk-minutes transcribes through the chunked path."""
+        mock_service.transcribe_file_parallel.return_value = _RESULT_SINGLE
+
+        self._run_main(monkeypatch, tmp_path, mock_service, _RESULT_SINGLE, "n", "--chunk-minutes", "5")
+
+        mock_service.transcribe_file_parallel.assert_awaited_once_with(
+            tmp_path / "test_audio.mp3", enable_sentiment_analysis=False, chunk_seconds=300.0
+        )
+        mock_service.transcribe_file.assert_not_called()
+
+    @pytest.mark.parametrize("minutes", ["0", "-1", "nan", "inf", "five"])
+    def test_cli_chunk_minutes_rejects_invalid(self, minutes, capsys):
+        """Test that a chunk length that isn't a positive number is a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            create_parser().parse_args(["audio.mp3", "--chunk-minutes", minutes])
+
+        assert exc_info.value.code == 2
+        assert "--chunk-minutes" in capsys.readouterr().err
+
+    def test_version_skips_parser(self, monkeypatch, capsys):
+        """Test that --version is answered without building the parser."""
+        def fail_create_parser():
+            raise AssertionError("parser should not be built")
+
+        monkeypatch.setattr(cli_module, "create_parser", fail_create_parser)
+        monkeypatch.setattr(sys, "argv", ["transcripter", "--version"])
+
+        with pytest.raises(SystemExit) as exc_info:
             main()
-            mock_exit.assert_not_called()  # Should not exit with error
-
-        # Verify the initial prompt was shown and SpeakerNamingService was not created
-        mock_input.assert_called_with("Would you like to name the speakers? [Y/n]: ")
-
-    @patch('transcripter.cli.TranscripterService')
-    @patch('transcripter.cli.get_config')
-    @patch('transcripter.cli.configure_logging')
-    @patch('builtins.input')
-    @patch('builtins.open', mock_open(read_data=""))
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    @patch('sys.argv', ['transcripter', 'test_audio.mp3', 'test_output.txt'])
-    def test_cli_single_speaker_naming_prompt_yes(self, mock_is_file, mock_exists, mock_input, mock_logging, mock_config, mock_service_class):
-        """Test CLI with single speaker - user chooses to name the speaker."""
-        # Set up mocks
-        mock_exists.return_value = True
-        mock_is_file.return_value = True
-        mock_config.return_value.output_dir = Path("output")
-        mock_service = MagicMock()
-        mock_service_class.return_value = mock_service
-
-        # Mock transcription result with single speaker
-        mock_result = MagicMock()
-        mock_utterance = MagicMock()
-        mock_utterance.speaker = "Speaker A"
-        mock_result.utterances = [mock_utterance]
-        mock_result.total_duration = 5
-        mock_result.processing_time_ms = 3000
-        mock_service.transcribe_file.return_value = mock_result
-
-        # Mock user input for single speaker prompt
-        mock_input.return_value = "y"
-
-        # Mock the SpeakerNamingService
-        with patch('transcripter.cli.SpeakerNamingService') as mock_naming_service_class:
-            mock_naming_service = MagicMock()
-            mock_naming_service_class.return_value = mock_naming_service
-            mock_naming_service.run_interactive_naming.return_value = True
-
-            # Run the CLI
-            with patch('sys.exit') as mock_exit:
-                main()
-                mock_exit.assert_not_called()  # Should not exit with error
-
-        # Verify the single speaker prompt was shown
-        mock_input.assert_called_with("Would you like to name the speaker? [Y/n]: ")
-
-    @patch('transcripter.cli.TranscripterService')
-    @patch('transcripter.cli.get_config')
-    @patch('transcripter.cli.configure_logging')
-    @patch('builtins.input')
-    @patch('builtins.open', mock_open(read_data=""))
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    @patch('sys.argv', ['transcripter', 'test_audio.mp3', 'test_output.txt'])
-    def test_cli_single_speaker_naming_prompt_no(self, mock_is_file, mock_exists, mock_input, mock_logging, mock_config, mock_service_class):
-        """Test CLI with single speaker - user chooses not to name the speaker."""
-        # Set up mocks
-        mock_exists.return_value = True
-        mock_is_file.return_value = True
-        mock_config.return_value.output_dir = Path("output")
-        mock_service = MagicMock()
-        mock_service_class.return_value = mock_service
-
-        # Mock transcription result with single speaker
-        mock_result = MagicMock()
-        mock_utterance = MagicMock()
-        mock_utterance.speaker = "Speaker A"
-        mock_result.utterances = [mock_utterance]
-        mock_result.total_duration = 5
-        mock_result.processing_time_ms = 3000
-        mock_service.transcribe_file.return_value = mock_result
-
-        # Mock user input for single speaker prompt
-        mock_input.return_value = "n"
-
-        # Run the CLI
-        with patch('sys.exit') as mock_exit:
-            main()
-            mock_exit.assert_not_called()  # Should not exit with error
 
-        # Verify the single speaker prompt was shown and SpeakerNamingService was not created
-        mock_input.assert_called_with("Would you like to name the speaker? [Y/n]: ")
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out == "Transcripter 0.1.0\n"
+
+    def test_parser_version_matches_fast_path(self, capsys):
+        """Test that --version combined with other arguments prints the same."""
+        with pytest.raises(SystemExit):
+            create_parser().parse_args(["--verbose", "--version"])
+
+        assert capsys.readouterr().out == "Transcripter 0.1.0\n"
+
+    def test_cli_import_defers_heavy_modules(self):
+        """Test that importing the CLI does not load the SDK or services."""
+        code = (
+            "import sys, transcripter.cli; "
+            "print(sorted(m for m in ('assemblyai', 'structlog', 'pydantic', "
+            "'transcripter.transcription_service') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "[]"
+
+
+class TestValidateInputs:
+    """Test cases for input validation."""
+
+    def test_missing_input_file_exits(self, tmp_path, capsys):
+        """Test that a missing input file is rejected."""
+        with pytest.raises(SystemExit):
+            validate_inputs(tmp_path / "missing.mp3", tmp_path / "out.txt")
+
+        assert "does not exist" in capsys.readouterr().err
+
+    def test_directory_input_exits(self, tmp_path, capsys):
+        """Test that a directory is rejected as input."""
+        with pytest.raises(SystemExit):
+            validate_inputs(tmp_path, tmp_path / "out.txt")
+
+        assert "not a file" in capsys.readouterr().err
+
+    def test_regular_file_accepted(self, tmp_path, capsys):
+        """Test that an existing audio file passes validation."""
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.write_bytes(b"")
+
+        validate_inputs(audio_file, tmp_path / "out.txt")
+
+        assert capsys.readouterr().err == ""
 
 
 class TestQuoteHandling:
     """Test cases for quote handling in file paths and names."""
 
-    def test_strip_outer_quotes_standard_double(self):
-        """Test stripping standard double quotes."""
-        assert strip_outer_quotes('"test.mp3"') == "test.mp3"
-        assert strip_outer_quotes('"path/to/file.mp3"') == "path/to/file.mp3"
-
-    def test_strip_outer_quotes_standard_single(self):
-        """Test stripping standard single quotes."""
-        assert strip_outer_quotes("'test.mp3'") == "test.mp3"
-        assert strip_outer_quotes("'path/to/file.mp3'") == "path/to/file.mp3"
-
-    def test_strip_outer_quotes_backticks(self):
-        """Test stripping backticks."""
-        assert strip_outer_quotes("`test.mp3`") == "test.mp3"
-        assert strip_outer_quotes("`path/to/file.mp3`") == "path/to/file.mp3"
-
-    def test_strip_outer_quotes_smart_double(self):
-        """Test stripping smart double quotes."""
-        # Using Unicode escape sequences to avoid syntax conflicts
-        assert strip_outer_quotes('\u201ctest.mp3\u201d') == "test.mp3"
-        assert strip_outer_quotes('\u201cpath/to/file.mp3\u201d') == "path/to/file.mp3"
-
-    def test_strip_outer_quotes_smart_single(self):
-        """Test stripping smart single quotes."""
-        # Using Unicode escape sequences to avoid syntax conflicts
-        assert strip_outer_quotes('\u2018test.mp3\u2019') == "test.mp3"
-        assert strip_outer_quotes('\u2018path/to/file.mp3\u2019') == "path/to/file.mp3"
-
-    def test_strip_outer_quotes_guillemets(self):
-        """Test stripping guillemets."""
-        assert strip_outer_quotes("«test.mp3»") == "test.mp3"
-        assert strip_outer_quotes("«path/to/file.mp3»") == "path/to/file.mp3"
-
-    def test_strip_outer_quotes_single_guillemets(self):
-        """Test stripping single guillemets."""
-        assert strip_outer_quotes("‹test.mp3›") == "test.mp3"
-        assert strip_outer_quotes("‹path/to/file.mp3›") == "path/to/file.mp3"
-
-    def test_strip_outer_quotes_german_double(self):
-        """Test stripping German-style double quotes."""
-        # Using Unicode escape sequences to avoid syntax conflicts
-        assert strip_outer_quotes('\u201etest.mp3\u201c') == "test.mp3"
-        assert strip_outer_quotes('\u201epath/to/file.mp3\u201c') == "path/to/file.mp3"
-
-    def test_strip_outer_quotes_german_single(self):
-        """Test stripping German-style single quotes."""
-        # Using Unicode escape sequences to avoid syntax conflicts
-        assert strip_outer_quotes('\u201atest.mp3\u2019') == "test.mp3"
-        assert strip_outer_quotes('\u201apath/to/file.mp3\u2019') == "path/to/file.mp3"
-
-    def test_preserve_inner_quotes_standard_double(self):
-        """Test that quotes within the filename are preserved."""
-        assert strip_outer_quotes('A "really ugly" conversation.mp4') == 'A "really ugly" conversation.mp4'
-        assert strip_outer_quotes('"A "really ugly" conversation.mp4"') == 'A "really ugly" conversation.mp4'
-
-    def test_preserve_inner_quotes_standard_single(self):
-        """Test that single quotes within the filename are preserved."""
-        assert strip_outer_quotes("A 'really ugly' conversation.mp4") == "A 'really ugly' conversation.mp4"
-        assert strip_outer_quotes("'A 'really ugly' conversation.mp4'") == "A 'really ugly' conversation.mp4"
-
-    def test_preserve_inner_quotes_mixed(self):
-        """Test filenames with various quote types inside."""
-        assert strip_outer_quotes('Meeting - "Q1" Results.mp4') == 'Meeting - "Q1" Results.mp4'
-        assert strip_outer_quotes("John's Interview.mp4") == "John's Interview.mp4"
-        assert strip_outer_quotes('`Special` recording.mp4') == '`Special` recording.mp4'
-
-    def test_no_quotes(self):
-        """Test strings without any quotes."""
-        assert strip_outer_quotes("test.mp3") == "test.mp3"
-        assert strip_outer_quotes("path/to/file.mp3") == "path/to/file.mp3"
-
-    def test_single_character(self):
-        """Test single character strings."""
-        assert strip_outer_quotes("a") == "a"
-        assert strip_outer_quotes('"') == '"'
-        assert strip_outer_quotes("'") == "'"
-
-    def test_empty_string(self):
-        """Test empty string."""
-        assert strip_outer_quotes("") == ""
-
-    def test_only_quotes(self):
-        """Test string with only quotes."""
-        assert strip_outer_quotes('""') == ""
-        assert strip_outer_quotes("''") == ""
-        assert strip_outer_quotes("``") == ""
-
-    def test_mismatched_quotes(self):
-        """Test that mismatched quotes are not stripped."""
-        assert strip_outer_quotes('"test.mp3\'') == '"test.mp3\''
-        assert strip_outer_quotes('\'test.mp3"') == '\'test.mp3"'
-        assert strip_outer_quotes('"test.mp3`') == '"test.mp3`'
+    @pytest.mark.parametrize(("value", "expected"), [
+        # Outer quotes of each supported style are stripped
+        pytest.param('"test.mp3"', "test.mp3", id="double"),
+        pytest.param('"path/to/file.mp3"', "path/to/file.mp3", id="double-path"),
+        pytest.param("'test.mp3'", "test.mp3", id="single"),
+        pytest.param("'path/to/file.mp3'", "path/to/file.mp3", id="single-path"),
+        pytest.param("`test.mp3`", "test.mp3", id="backtick"),
+        pytest.param("`path/to/file.mp3`", "path/to/file.mp3", id="backtick-path"),
+        pytest.param('\u201ctest.mp3\u201d', "test.mp3", id="smart-double"),
+        pytest.param('\u201cpath/to/file.mp3\u201d', "path/to/file.mp3", id="smart-double-path"),
+        pytest.param('\u2018test.mp3\u2019', "test.mp3", id="smart-single"),
+        pytest.param('\u2018path/to/file.mp3\u2019', "path/to/file.mp3", id="smart-single-path"),
+        pytest.param("«test.mp3»", "test.mp3", id="guillemets"),
+        pytest.param("«path/to/file.mp3»", "path/to/file.mp3", id="guillemets-path"),
+        pytest.param("‹test.mp3›", "test.mp3", id="single-guillemets"),
+        pytest.param("‹path/to/file.mp3›", "path/to/file.mp3", id="single-guillemets-path"),
+        pytest.param('\u201etest.mp3\u201c', "test.mp3", id="german-double"),
+        pytest.param('\u201epath/to/file.mp3\u201c', "path/to/file.mp3", id="german-double-path"),
+        pytest.param('\u201atest.mp3\u2019', "test.mp3", id="german-single"),
+        pytest.param('\u201apath/to/file.mp3\u2019', "path/to/file.mp3", id="german-single-path"),
+        # Quotes within the filename are preserved
+        pytest.param('A "really ugly" conversation.mp4', 'A "really ugly" conversation.mp4', id="inner-double"),
+        pytest.param('"A "really ugly" conversation.mp4"', 'A "really ugly" conversation.mp4', id="outer-and-inner-double"),
+        pytest.param("A 'really ugly' conversation.mp4", "A 'really ugly' conversation.mp4", id="inner-single"),
+        pytest.param("'A 'really ugly' conversation.mp4'", "A 'really ugly' conversation.mp4", id="outer-and-inner-single"),
+        pytest.param('Meeting - "Q1" Results.mp4', 'Meeting - "Q1" Results.mp4', id="inner-mixed-double"),
+        pytest.param("John's Interview.mp4", "John's Interview.mp4", id="apostrophe"),
+        pytest.param('`Special` recording.mp4', '`Special` recording.mp4', id="inner-backtick"),
+        pytest.param(
+            '"Meeting - "Strategic Plan" - Jan 2025.mp4"', 'Meeting - "Strategic Plan" - Jan 2025.mp4',
+            id="complex-outer",
+        ),
+        pytest.param(
+            'Meeting - "Strategic Plan" - Jan 2025.mp4', 'Meeting - "Strategic Plan" - Jan 2025.mp4',
+            id="complex-inner",
+        ),
+        pytest.param('\u201cMeeting - "Q1" Results.mp4\u201d', 'Meeting - "Q1" Results.mp4', id="nested-smart"),
+        # Strings without matching outer quotes are left alone
+        pytest.param("test.mp3", "test.mp3", id="no-quotes"),
+        pytest.param("path/to/file.mp3", "path/to/file.mp3", id="no-quotes-path"),
+        pytest.param("a", "a", id="single-char"),
+        pytest.param('"', '"', id="lone-double"),
+        pytest.param("'", "'", id="lone-single"),
+        pytest.param("", "", id="empty"),
+        pytest.param('""', "", id="only-double"),
+        pytest.param("''", "", id="only-single"),
+        pytest.param("``", "", id="only-backticks"),
+        pytest.param('"test.mp3\'', '"test.mp3\'', id="mismatched-double-single"),
+        pytest.param('\'test.mp3"', '\'test.mp3"', id="mismatched-single-double"),
+        pytest.param('"test.mp3`', '"test.mp3`', id="mismatched-double-backtick"),
+    ])
+    def test_strip_outer_quotes(self, value, expected):
+        """Test that only a matching pair of outer quotes is stripped."""
+        assert strip_outer_quotes(value) == expected
 
     def test_path_with_quote_stripping(self):
         """Test path conversion with quote stripping."""
@@ -283,22 +260,3 @@ class TestQuoteHandling:
         result = path_with_quote_stripping('A "really ugly" conversation.mp4')
         assert isinstance(result, Path)
         assert str(result) == 'A "really ugly" conversation.mp4'
-
-    def test_complex_filename_with_outer_quotes(self):
-        """Test complex filename with both outer and inner quotes."""
-        # Outer quotes should be stripped, inner preserved
-        input_str = '"Meeting - "Strategic Plan" - Jan 2025.mp4"'
-        expected = 'Meeting - "Strategic Plan" - Jan 2025.mp4'
-        assert strip_outer_quotes(input_str) == expected
-
-        # Without outer quotes, everything preserved
-        input_str = 'Meeting - "Strategic Plan" - Jan 2025.mp4'
-        expected = 'Meeting - "Strategic Plan" - Jan 2025.mp4'
-        assert strip_outer_quotes(input_str) == expected
-
-    def test_nested_smart_quotes(self):
-        """Test nested smart quotes."""
-        # Outer smart quotes should be stripped, using Unicode escapes
-        input_str = '\u201cMeeting - "Q1" Results.mp4\u201d'
-        expected = 'Meeting - "Q1" Results.mp4'
-        assert strip_outer_quotes(input_str) == expected
@@ -4,6 +4,8 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
+from dotenv import dotenv_values
+
 from transcripter.config import (
     TranscripterConfig,
     generate_correlation_id,
@@ -26,31 +28,82 @@ class TestTranscripterConfig:
         assert config.max_retries == 3
         assert config.timeout == 300
 
-    def test_config_from_env_vars(self):
+    def test_config_from_env_vars(self, monkeypatch):
         """Test configuration from environment variables."""
-        env_vars = {
-            "TRANSCRIPTER_ASSEMBLYAI_API_KEY": "test_api_key",
-            "TRANSCRIPTER_LOG_LEVEL": "DEBUG",
-            "TRANSCRIPTER_MAX_RETRIES": "5",
-            "TRANSCRIPTER_TIMEOUT": "600"
-        }
-
-        with patch.dict(os.environ, env_vars):
-            config = TranscripterConfig()
-
-            assert config.assemblyai_api_key == "test_api_key"
-            assert config.log_level == "DEBUG"
-            assert config.max_retries == 5
-            assert config.timeout == 600
-
-    def test_output_dir_creation(self):
-        """Test that output directory is created during initialization."""
-        test_dir = Path("./test_output_dir")
-
-        # Mock the mkdir method
+        monkeypatch.setenv("TRANSCRIPTER_ASSEMBLYAI_API_KEY", "test_api_key")
+        monkeypatch.setenv("TRANSCRIPTER_LOG_LEVEL", "DEBUG")
+        monkeypatch.setenv("TRANSCRIPTER_MAX_RETRIES", "5")
+        monkeypatch.setenv("TRANSCRIPTER_TIMEOUT", "600")
+
+        config = TranscripterConfig()
+
+        assert config.assemblyai_api_key == "test_api_key"
+        assert config.log_level == "DEBUG"
+        assert config.max_retries == 5
+        assert config.timeout == 600
+
+    def test_env_file_parsed_once(self, tmp_path, monkeypatch):
+        """Test that an unchanged env file is not re-parsed for each config."""
+        monkeypatch.chdir(tmp_path)
+        Path(".env").write_text("TRANSCRIPTER_LOG_LEVEL=WARNING\n")
+
+        with patch('transcripter.config.dotenv_values', wraps=dotenv_values) as mock_read:
+            first = TranscripterConfig()
+            second = TranscripterConfig()
+
+        assert first.log_level == second.log_level == "WARNING"
+        mock_read.assert_called_once()
+
+    def test_modified_env_file_reparsed(self, tmp_path, monkeypatch):
+        """Test that changes to an env file are picked up."""
+        monkeypatch.chdir(tmp_path)
+        env_file = Path(".env")
+        env_file.write_text("TRANSCRIPTER_LOG_LEVEL=WARNING\n")
+        assert TranscripterConfig().log_level == "WARNING"
+
+        env_file.write_text("TRANSCRIPTER_LOG_LEVEL=ERROR\n")
+        os.utime(env_file, ns=(0, 0))
+
+        assert TranscripterConfig().log_level == "ERROR"
+
+    def test_default_env_files_merged_in_order(self, tmp_path, monkeypatch):
+        """Test that both default env files are read, later files winning."""
+        monkeypatch.chdir(tmp_path)
+        Path(".env.local").write_text("TRANSCRIPTER_LOG_LEVEL=ERROR\nTRANSCRIPTER_MAX_RETRIES=7\n")
+        Path(".env").write_text("TRANSCRIPTER_LOG_LEVEL=WARNING\n")
+
+        config = TranscripterConfig()
+
+        assert config.max_retries == 7
+        assert config.log_level == "WARNING"
+
+    def test_env_file_none_disables_dotenv(self, tmp_path, monkeypatch):
+        """Test that an explicit _env_file=None skips the default env files."""
+        monkeypatch.chdir(tmp_path)
+        Path(".env").write_text("TRANSCRIPTER_LOG_LEVEL=WARNING\n")
+
+        assert TranscripterConfig(_env_file=None).log_level == "INFO"
+
+    def test_env_file_keys_case_insensitive(self, tmp_path, monkeypatch):
+        """Test that env file keys match fields regardless of case."""
+        monkeypatch.chdir(tmp_path)
+        Path(".env").write_text("transcripter_max_retries=9\n")
+
+        assert TranscripterConfig().max_retries == 9
+
+    def test_output_dir_creation(self, tmp_path):
+        """Test that output directory and its parents are created during initialization."""
+        output_dir = tmp_path / "nested" / "output"
+
+        TranscripterConfig(output_dir=output_dir)
+
+        assert output_dir.is_dir()
+
+    def test_existing_output_dir_not_recreated(self, tmp_path):
+        """Test that mkdir is skipped when the output directory already exists."""
         with patch.object(Path, 'mkdir') as mock_mkdir:
-            TranscripterConfig(output_dir=test_dir)
-            mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+            TranscripterConfig(output_dir=tmp_path)
+            mock_mkdir.assert_not_called()
 
 
 class TestCorrelationID:
@@ -61,20 +114,19 @@ class TestCorrelationID:
         cid1 = generate_correlation_id()
         cid2 = generate_correlation_id()
 
-        # Should be different UUIDs
+        # Should be different random hex IDs
         assert cid1 != cid2
-        assert len(cid1) == 36  # UUID string length
-        assert len(cid2) == 36
+        assert len(cid1) == 32  # 16 random bytes as hex
+        assert len(cid2) == 32
+        int(cid1, 16)
 
     def test_get_correlation_id_without_set(self):
         """Test getting correlation ID when none is set."""
-        # Clear any existing correlation ID
-        set_correlation_id("")
-        # Get a new correlation ID
         cid = get_correlation_id()
 
-        # Should generate a new one
-        assert len(cid) == 36
+        # Should generate a new one and keep it for the rest of the context
+        assert len(cid) == 32
+        assert get_correlation_id() == cid
 
     def test_set_and_get_correlation_id(self):
         """Test setting and getting correlation ID."""
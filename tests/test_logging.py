@@ -0,0 +1,179 @@
+"""Tests for structured logging setup."""
+
+import io
+import logging
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+import structlog
+
+from transcripter import logging as transcripter_logging
+from transcripter.config import set_correlation_id
+from transcripter.logging import (
+    _CoalescingWriter,
+    _log_sink,
+    _TextWriter,
+    configure_logging,
+    get_logger,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_flush_hooks(monkeypatch):
+    """Let each test install the flush hooks against its own patched atexit and excepthook."""
+    monkeypatch.setattr(transcripter_logging, "_hooks_installed", False)
+
+
+class TestLogSink:
+    """Test selection of the log output stream."""
+
+    def test_debug_flushes_each_event(self):
+        """Test that verbose runs are not buffered."""
+        stream = MagicMock()
+        writer = _TextWriter(stream)
+
+        writer.write(b"event\n")
+        writer.flush()
+
+        stream.write.assert_called_once_with("event\n")
+        stream.flush.assert_called_once()
+
+    def test_debug_sink_is_unbuffered_writer(self):
+        """Test that verbose runs don't coalesce events."""
+        sink = _log_sink(logging.DEBUG)
+
+        assert type(sink) is _TextWriter
+
+    def test_info_coalesces_writes(self, monkeypatch):
+        """Test that non-verbose runs defer flushing to exit."""
+        registered = []
+        monkeypatch.setattr(transcripter_logging.atexit, "register", registered.append)
+        monkeypatch.setattr(sys, "excepthook", sys.excepthook)
+
+        sink = _log_sink(logging.INFO)
+
+        assert isinstance(sink, _CoalescingWriter)
+        assert registered == [sys.stdout.flush]
+
+    def test_flush_hooks_installed_once(self, monkeypatch):
+        """Test that reconfiguring doesn't stack exit hooks or excepthook wrappers."""
+        registered = []
+        monkeypatch.setattr(transcripter_logging.atexit, "register", registered.append)
+        monkeypatch.setattr(sys, "excepthook", sys.excepthook)
+
+        _log_sink(logging.INFO)
+        hook = sys.excepthook
+        _log_sink(logging.WARNING)
+
+        assert registered == [sys.stdout.flush]
+        assert sys.excepthook is hook
+
+    def test_coalescing_writer_ignores_flush(self):
+        """Test that per-event flushes are not forwarded."""
+        stream = MagicMock()
+        writer = _CoalescingWriter(stream)
+
+        writer.write(b"event\n")
+        writer.flush()
+
+        stream.write.assert_called_once_with("event\n")
+        stream.flush.assert_not_called()
+
+    def test_events_stay_in_order_with_print(self, monkeypatch):
+        """Test that events written while print() output is still buffered don't overtake it."""
+        monkeypatch.setattr(transcripter_logging.atexit, "register", lambda func: None)
+        monkeypatch.setattr(sys, "excepthook", sys.excepthook)
+        raw = io.BytesIO()
+        stdout = io.TextIOWrapper(raw, encoding="utf-8")
+        monkeypatch.setattr(sys, "stdout", stdout)
+
+        print("Transcribing meeting.mp3...")
+        _log_sink(logging.INFO).write(b'{"event":"hello"}\n')
+        stdout.flush()
+
+        assert raw.getvalue() == b'Transcribing meeting.mp3...\n{"event":"hello"}\n'
+
+    def test_excepthook_flushes_pending_events(self, monkeypatch):
+        """Test that stdout is flushed before a crash is reported."""
+        reported = []
+        monkeypatch.setattr(transcripter_logging.atexit, "register", lambda func: None)
+        monkeypatch.setattr(sys, "excepthook", lambda *args: reported.append(args))
+        _log_sink(logging.INFO)
+        mock_stdout = MagicMock()
+        monkeypatch.setattr(sys, "stdout", mock_stdout)
+
+        sys.excepthook(ValueError, ValueError("boom"), None)
+
+        mock_stdout.flush.assert_called_once()
+        assert reported[0][0] is ValueError
+
+
+class TestConfigureLogging:
+    """Test structlog configuration."""
+
+    def teardown_method(self):
+        """Restore structlog defaults."""
+        structlog.reset_defaults()
+        structlog.contextvars.clear_contextvars()
+
+    def test_events_render_as_json_bytes(self, capsysbinary):
+        """Test that events are rendered as JSON lines on stdout."""
+        configure_logging("DEBUG")
+
+        get_logger("test").info("hello", answer=42)
+
+        line = capsysbinary.readouterr().out.strip()
+        assert line.startswith(b"{")
+        assert b'"event":"hello"' in line
+        assert b'"answer":42' in line
+        assert b'"correlation_id"' in line
+
+    def test_level_filtering(self, capsysbinary, monkeypatch):
+        """Test that events below the configured level are dropped."""
+        monkeypatch.setattr(transcripter_logging.atexit, "register", lambda func: None)
+        monkeypatch.setattr(sys, "excepthook", sys.excepthook)
+        configure_logging("WARNING")
+
+        get_logger("test").info("hidden")
+
+        assert capsysbinary.readouterr().out == b""
+
+    def test_stack_info_rendered_only_when_debugging(self, monkeypatch):
+        """Test that the stack renderer is skipped outside of verbose runs."""
+        monkeypatch.setattr(transcripter_logging.atexit, "register", lambda func: None)
+        monkeypatch.setattr(sys, "excepthook", sys.excepthook)
+
+        configure_logging("INFO")
+        info_processors = structlog.get_config()["processors"]
+        configure_logging("DEBUG")
+        debug_processors = structlog.get_config()["processors"]
+
+        def has_stack_renderer(processors):
+            return any(isinstance(p, structlog.processors.StackInfoRenderer) for p in processors)
+
+        assert not has_stack_renderer(info_processors)
+        assert has_stack_renderer(debug_processors)
+
+    def test_exception_tracebacks_rendered(self, capsysbinary, monkeypatch):
+        """Test that exc_info is still rendered outside of verbose runs."""
+        monkeypatch.setattr(transcripter_logging.atexit, "register", lambda func: None)
+        monkeypatch.setattr(sys, "excepthook", sys.excepthook)
+        configure_logging("INFO")
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            get_logger("test").error("failed", exc_info=True)
+        sys.stdout.flush()
+
+        assert b"ValueError: boom" in capsysbinary.readouterr().out
+
+    def test_correlation_id_follows_set_correlation_id(self, capsysbinary):
+        """Test that events pick up a correlation ID set after configuration."""
+        configure_logging("DEBUG")
+
+        set_correlation_id("request-42")
+        get_logger("test").info("hello")
+
+        assert b'"correlation_id":"request-42"' in capsysbinary.readouterr().out
@@ -1,10 +1,34 @@
 """Tests for data models."""
 
+import json
 from pathlib import Path
 
+import pytest
+from pydantic import ValidationError
+
 from transcripter.models import SentimentResult, SpeakerUtterance, TranscriptionResult
 
 
+@pytest.fixture(scope="module")
+def two_utterances():
+    """Two speakers taking one turn each; models are frozen, so tests can share them."""
+    return [
+        SpeakerUtterance(speaker="A", text="Hello, how are you?", start=1000, end=3000),
+        SpeakerUtterance(speaker="B", text="I'm doing well, thank you.", start=3500, end=6000),
+    ]
+
+
+@pytest.fixture(scope="module")
+def multi_result(two_utterances):
+    """A result built from ``two_utterances``."""
+    return TranscriptionResult(
+        utterances=two_utterances,
+        total_duration=6,
+        processing_time_ms=1500,
+        audio_file=Path("test.mp3")
+    )
+
+
 class TestSpeakerUtterance:
     """Test SpeakerUtterance model."""
 
@@ -24,97 +48,126 @@ class TestSpeakerUtterance:
         assert utterance.end == 3000
         assert utterance.confidence == 0.95
 
+    def test_speaker_labels_are_interned(self):
+        """Test that equal speaker labels share one string object."""
+        first = SpeakerUtterance(speaker="".join(["Speaker", " A"]), text="Hi", start=0, end=1)
+        second = SpeakerUtterance(speaker="".join(["Speaker", " A"]), text="Yo", start=1, end=2)
+
+        assert first.speaker is second.speaker
+
+    def test_speaker_utterance_is_frozen(self):
+        """Test that utterances cannot be modified after creation."""
+        utterance = SpeakerUtterance(speaker="A", text="Hello", start=0, end=1000)
+
+        with pytest.raises(ValidationError):
+            utterance.text = "Changed"
+
+    def test_speaker_utterance_rejects_unknown_fields(self):
+        """Test that unexpected fields are rejected."""
+        with pytest.raises(ValidationError):
+            SpeakerUtterance(speaker="A", text="Hello", start=0, end=1000, words=[])
+
 
 class TestTranscriptionResult:
     """Test TranscriptionResult model."""
 
-    def test_transcription_result_creation(self):
+    def test_transcription_result_creation(self, multi_result):
         """Test creating a transcription result."""
-        utterances = [
-            SpeakerUtterance(
-                speaker="A",
-                text="Hello, how are you?",
-                start=1000,
-                end=3000
-            ),
-            SpeakerUtterance(
-                speaker="B",
-                text="I'm doing well, thank you.",
-                start=3500,
-                end=6000
-            )
-        ]
+        assert len(multi_result.utterances) == 2
+        assert multi_result.total_duration == 6
+        assert multi_result.processing_time_ms == 1500
+        assert multi_result.audio_file == Path("test.mp3")
 
+    def test_speaker_count(self):
+        """Test counting distinct speakers."""
         result = TranscriptionResult(
-            utterances=utterances,
-            total_duration=6,
-            processing_time_ms=1500,
+            utterances=[
+                SpeakerUtterance(speaker="A", text="Hi", start=0, end=1000),
+                SpeakerUtterance(speaker="B", text="Hello", start=1000, end=2000),
+                SpeakerUtterance(speaker="A", text="Bye", start=2000, end=3000),
+            ],
             audio_file=Path("test.mp3")
         )
 
-        assert len(result.utterances) == 2
-        assert result.total_duration == 6
-        assert result.processing_time_ms == 1500
-        assert result.audio_file == Path("test.mp3")
+        assert result.speaker_count == 2
+        assert "speaker_count" not in result.model_dump()
+
+    def test_speaker_count_follows_model_copy(self, sample_result):
+        """Test that a copy with different utterances counts its own speakers."""
+        assert sample_result.speaker_count == 1
+
+        copy = sample_result.model_copy(update={"utterances": [
+            SpeakerUtterance(speaker="A", text="Hi", start=0, end=1000),
+            SpeakerUtterance(speaker="B", text="Hello", start=1000, end=2000),
+        ]})
 
-    def test_to_transcript_text(self):
+        assert copy.speaker_count == 2
+
+    def test_to_transcript_text(self, multi_result):
         """Test converting to transcript text format."""
-        utterances = [
-            SpeakerUtterance(
-                speaker="A",
-                text="Hello, how are you?",
-                start=1000,
-                end=3000
-            ),
-            SpeakerUtterance(
-                speaker="B",
-                text="I'm doing well, thank you.",
-                start=3500,
-                end=6000
-            )
-        ]
+        expected = "Speaker A: Hello, how are you?\n\nSpeaker B: I'm doing well, thank you."
+        assert multi_result.to_transcript_text() == expected
 
+    def test_to_srt_format(self, multi_result):
+        """Test converting to SRT subtitle format."""
+        srt_content = multi_result.to_srt_format()
+        assert "00:00:01,000 --> 00:00:03,000" in srt_content
+        assert "Speaker A: Hello, how are you?" in srt_content
+        assert "00:00:03,500 --> 00:00:06,000" in srt_content
+
+    def test_iterators_match_full_renderings(self):
+        """Test that streamed chunks join to the same text as the full renderings."""
         result = TranscriptionResult(
-            utterances=utterances,
-            audio_file=Path("test.mp3")
+            utterances=[
+                SpeakerUtterance(speaker="A", text="Hello", start=0, end=1000),
+                SpeakerUtterance(speaker="B", text="Hi", start=1000, end=2000),
+            ],
+            audio_file=Path("test.mp3"),
+            sentiment_results=[
+                SentimentResult(text="Hello", sentiment="POSITIVE", confidence=0.9, start=0, end=1000, speaker="A"),
+            ],
         )
 
-        expected = "Speaker A: Hello, how are you?\n\nSpeaker B: I'm doing well, thank you."
-        assert result.to_transcript_text() == expected
+        cues = list(result.iter_srt_cues())
+        assert len(cues) == 2
+        assert "".join(cues) == result.to_srt_format()
+        assert "".join(result.iter_transcript_lines()) == result.to_transcript_text()
 
-    def test_to_srt_format(self):
-        """Test converting to SRT subtitle format."""
-        utterances = [
-            SpeakerUtterance(
-                speaker="A",
-                text="Hello, how are you?",
-                start=1000,
-                end=3000
-            )
-        ]
+    def test_iterators_on_empty_result(self):
+        """Test that an empty result yields no chunks."""
+        result = TranscriptionResult(audio_file=Path("test.mp3"))
+
+        assert list(result.iter_srt_cues()) == []
+        assert list(result.iter_transcript_lines()) == []
 
+    def test_iter_jsonl(self):
+        """Test that each utterance becomes one JSON line."""
         result = TranscriptionResult(
-            utterances=utterances,
-            audio_file=Path("test.mp3")
+            utterances=[
+                SpeakerUtterance(speaker="A", text="Héllo \"there\"", start=0, end=1000, confidence=0.9),
+                SpeakerUtterance(speaker="B", text="Hi", start=1000, end=2000),
+            ],
+            audio_file=Path("test.mp3"),
         )
 
-        srt_content = result.to_srt_format()
-        assert "00:00:01,000 --> 00:00:03,000" in srt_content
-        assert "Speaker A: Hello, how are you?" in srt_content
+        lines = list(result.iter_jsonl())
 
-    def test_ms_to_srt_time_conversion(self):
-        """Test milliseconds to SRT time format conversion."""
-        # Test various time conversions
-        test_cases = [
-            (1000, "00:00:01,000"),
-            (61000, "00:01:01,000"),
-            (3661000, "01:01:01,000"),
-            (123, "00:00:00,123")
+        assert [json.loads(line) for line in lines] == [
+            {"speaker": "A", "start": 0, "end": 1000, "text": "Héllo \"there\""},
+            {"speaker": "B", "start": 1000, "end": 2000, "text": "Hi"},
         ]
-
-        for ms, expected in test_cases:
-            result = TranscriptionResult._ms_to_srt_time(ms)
-            assert result == expected
+        assert all(line.endswith(b"\n") and line.count(b"\n") == 1 for line in lines)
+        assert "Héllo".encode() in lines[0]
+
+    @pytest.mark.parametrize(("ms", "expected"), [
+        (1000, "00:00:01,000"),
+        (61000, "00:01:01,000"),
+        (3661000, "01:01:01,000"),
+        (123, "00:00:00,123"),
+    ])
+    def test_ms_to_srt_time_conversion(self, ms, expected):
+        """Test milliseconds to SRT time format conversion."""
+        assert TranscriptionResult._ms_to_srt_time(ms) == expected
 
 
 class TestSentimentResult:
@@ -241,25 +294,11 @@ class TestTranscriptionResultWithSentiment:
         assert "(confidence: 0.92)" in text
         assert "(confidence: 0.85)" in text
 
-    def test_to_transcript_text_without_sentiment(self):
+    def test_to_transcript_text_without_sentiment(self, multi_result):
         """Test transcript text without sentiment analysis (default behavior)."""
-        utterances = [
-            SpeakerUtterance(
-                speaker="A",
-                text="Hello world",
-                start=1000,
-                end=3000
-            )
-        ]
-
-        result = TranscriptionResult(
-            utterances=utterances,
-            audio_file=Path("test.mp3")
-        )
-
-        text = result.to_transcript_text()
+        text = multi_result.to_transcript_text()
 
         # Should not have sentiment section
         assert "SENTIMENT ANALYSIS" not in text
-        assert "Speaker A: Hello world" in text
+        assert "Speaker A: Hello, how are you?" in text
 
@@ -0,0 +1,80 @@
+"""Tests for client-side rate limiting."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from transcripter.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Test RateLimiter token bucket."""
+
+    def test_burst_up_to_capacity_does_not_wait(self):
+        """Test that a full bucket admits capacity requests immediately."""
+        limiter = RateLimiter(rate=1, capacity=3)
+
+        with patch('transcripter.rate_limiter.asyncio.sleep') as mock_sleep:
+            for _ in range(3):
+                asyncio.run(limiter.acquire())
+
+        mock_sleep.assert_not_called()
+
+    def test_waits_for_refill_when_empty(self):
+        """Test that an empty bucket waits for the time needed to refill a token."""
+        clock = [100.0]
+
+        async def fake_sleep(delay):
+            clock[0] += delay
+
+        with patch('transcripter.rate_limiter.time.monotonic', side_effect=lambda: clock[0]), \
+             patch('transcripter.rate_limiter.asyncio.sleep', side_effect=fake_sleep) as mock_sleep:
+            limiter = RateLimiter(rate=2, capacity=1)
+            asyncio.run(limiter.acquire())
+            asyncio.run(limiter.acquire())
+
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_refill_capped_at_capacity(self):
+        """Test that idle time doesn't accumulate more than capacity tokens."""
+        clock = [0.0]
+
+        async def fake_sleep(delay):
+            clock[0] += delay
+
+        with patch('transcripter.rate_limiter.time.monotonic', side_effect=lambda: clock[0]), \
+             patch('transcripter.rate_limiter.asyncio.sleep', side_effect=fake_sleep) as mock_sleep:
+            limiter = RateLimiter(rate=1, capacity=2)
+            clock[0] = 1000.0
+            for _ in range(3):
+                asyncio.run(limiter.acquire())
+
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_wait_blocks_until_refill(self):
+        """Test that synchronous callers sleep for the time needed to refill a token."""
+        clock = [100.0]
+
+        def fake_sleep(delay):
+            clock[0] += delay
+
+        with patch('transcripter.rate_limiter.time.monotonic', side_effect=lambda: clock[0]), \
+             patch('transcripter.rate_limiter.time.sleep', side_effect=fake_sleep) as mock_sleep:
+            limiter = RateLimiter(rate=2, capacity=1)
+            limiter.wait()
+            limiter.wait()
+
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_acquire_more_than_capacity(self):
+        """Test that requesting more tokens than the bucket holds fails instead of waiting forever."""
+        limiter = RateLimiter(rate=1, capacity=2)
+
+        with pytest.raises(ValueError, match="Cannot acquire"):
+            asyncio.run(limiter.acquire(3))
+
+    def test_invalid_rate(self):
+        """Test that non-positive settings are rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0, capacity=1)
@@ -1,7 +1,8 @@
 """Tests for the SpeakerNamingService."""
 
-from pathlib import Path
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
+
+import pytest
 
 from transcripter.speaker_naming_service import SpeakerNamingService
 
@@ -9,9 +10,10 @@ from transcripter.speaker_naming_service import SpeakerNamingService
 class TestSpeakerNamingService:
     """Test cases for SpeakerNamingService."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.test_file = Path("test_transcript.txt")
+    @pytest.fixture(autouse=True)
+    def _service(self, tmp_path):
+        """Set up a service for a transcript file in a temporary directory."""
+        self.test_file = tmp_path / "test_transcript.txt"
         self.service = SpeakerNamingService(self.test_file)
 
     def test_init(self):
@@ -23,20 +25,21 @@ class TestSpeakerNamingService:
 
     def test_analyze_transcript_success(self):
         """Test successful transcript analysis."""
-        transcript_content = """Speaker A: Hello, how are you today?
+        transcript_content = b"""Speaker A: Hello, how are you today?
 Speaker B: I'm doing well, thank you for asking.
 Speaker A: That's great to hear.
 Speaker C: I agree, it's a wonderful day.
 """
 
-        with patch("builtins.open", mock_open(read_data=transcript_content)):
-            result = self.service.analyze_transcript()
+        self.test_file.write_bytes(transcript_content)
+        result = self.service.analyze_transcript()
 
         assert result is True
         assert len(self.service.speakers) == 3
         assert "Speaker A" in self.service.speakers
         assert "Speaker B" in self.service.speakers
         assert "Speaker C" in self.service.speakers
+        assert list(self.service.speakers) == ["Speaker A", "Speaker B", "Speaker C"]
 
         assert len(self.service.utterances) == 4
         assert self.service.utterances[0] == ("Speaker A", "Hello, how are you today?")
@@ -44,12 +47,12 @@ Speaker C: I agree, it's a wonderful day.
 
     def test_analyze_transcript_no_speakers(self):
         """Test transcript analysis with no speakers."""
-        transcript_content = """This is just regular text without any speakers.
+        transcript_content = b"""This is just regular text without any speakers.
 More text here.
 """
 
-        with patch("builtins.open", mock_open(read_data=transcript_content)):
-            result = self.service.analyze_transcript()
+        self.test_file.write_bytes(transcript_content)
+        result = self.service.analyze_transcript()
 
         assert result is False
         assert len(self.service.speakers) == 0
@@ -57,8 +60,8 @@ More text here.
 
     def test_analyze_transcript_empty_file(self):
         """Test transcript analysis with empty file."""
-        with patch("builtins.open", mock_open(read_data="")):
-            result = self.service.analyze_transcript()
+        self.test_file.write_bytes(b"")
+        result = self.service.analyze_transcript()
 
         assert result is False
         assert len(self.service.speakers) == 0
@@ -73,14 +76,14 @@ More text here.
 
     def test_analyze_transcript_ignores_speaker_in_middle_of_line(self):
         """Test that speaker detection only works at line start."""
-        transcript_content = """Hello Speaker A: this should not be detected
+        transcript_content = b"""Hello Speaker A: this should not be detected
 Speaker A: This should be detected
 Some text Speaker B: also ignored
 Speaker B: This should be detected
 """
 
-        with patch("builtins.open", mock_open(read_data=transcript_content)):
-            result = self.service.analyze_transcript()
+        self.test_file.write_bytes(transcript_content)
+        result = self.service.analyze_transcript()
 
         assert result is True
         assert len(self.service.speakers) == 2
@@ -88,13 +91,13 @@ Speaker B: This should be detected
 
     def test_analyze_transcript_single_speaker(self):
         """Test transcript analysis with single speaker."""
-        transcript_content = """Speaker A: Hello, welcome to today's training session.
+        transcript_content = b"""Speaker A: Hello, welcome to today's training session.
 Speaker A: Today we'll be covering the basics of our system.
 Speaker A: Let's start with an overview of the main features.
 """
 
-        with patch("builtins.open", mock_open(read_data=transcript_content)):
-            result = self.service.analyze_transcript()
+        self.test_file.write_bytes(transcript_content)
+        result = self.service.analyze_transcript()
 
         assert result is True
         assert len(self.service.speakers) == 1
@@ -164,6 +167,17 @@ Speaker A: Let's start with an overview of the main features.
         context = self.service.get_speaker_context("Speaker C", 0)
         assert len(context) == 0
 
+    def test_get_speaker_context_after_analysis(self):
+        """Test that context lookups use the positions recorded during analysis."""
+        transcript_content = b"Speaker A: One\nSpeaker B: Two\nSpeaker A: Three\nSpeaker B: Four\n"
+
+        self.test_file.write_bytes(transcript_content)
+        self.service.analyze_transcript()
+
+        context = self.service.get_speaker_context("Speaker B", 1)
+
+        assert context == [("Speaker A", "Three"), ("Speaker B", "Four")]
+
     def test_advance_speaker_utterance_index_success(self):
         """Test successfully advancing to next utterance."""
         self.service.utterances = [
@@ -375,29 +389,29 @@ Speaker A: Let's start with an overview of the main features.
         captured = capsys.readouterr()
         assert "Found 1 speaker: Speaker A" in captured.out
 
-    def test_apply_speaker_names_success(self):
+    def test_apply_speaker_names_success(self, tmp_path):
         """Test successful application of speaker names."""
+        transcript_file = tmp_path / "transcript.txt"
+        transcript_file.write_bytes(b"""Speaker A: Hello there
+Speaker B: How are you?
+Speaker C: I'm fine, thanks
+Speaker A: That's great
+""")
+        service = SpeakerNamingService(transcript_file)
         # Set up speakers with some renamed
-        self.service.speakers = {
+        service.speakers = {
             "Speaker A": "Bob",
             "Speaker B": "Speaker B",  # Not renamed
             "Speaker C": "Alice",
         }
 
-        original_content = """Speaker A: Hello there
-Speaker B: How are you?
-Speaker C: I'm fine, thanks
-Speaker A: That's great
-"""
-
-
-        with patch("builtins.open", mock_open(read_data=original_content)) as mock_file:
-            mock_file.return_value.__enter__.return_value.write.side_effect = None
-            result = self.service.apply_speaker_names()
+        result = service.apply_speaker_names()
 
         assert result is True
-        # Verify write was called
-        mock_file.return_value.__enter__.return_value.write.assert_called()
+        assert transcript_file.read_bytes() == (
+            b"Bob: Hello there\nSpeaker B: How are you?\nAlice: I'm fine, thanks\nBob: That's great\n"
+        )
+        assert list(tmp_path.iterdir()) == [transcript_file]
 
     def test_apply_speaker_names_no_changes(self):
         """Test applying speaker names when no changes are needed."""
@@ -406,14 +420,12 @@ Speaker A: That's great
             "Speaker B": "Speaker B",
         }
 
-        original_content = """Speaker A: Hello
-Speaker B: Hi there
-"""
-
-        with patch("builtins.open", mock_open(read_data=original_content)):
+        with patch("builtins.open") as mock_file:
             result = self.service.apply_speaker_names()
 
         assert result is True
+        # Nothing to rename, so the transcript isn't rewritten
+        mock_file.assert_not_called()
 
     def test_apply_speaker_names_file_error(self):
         """Test applying speaker names with file error."""
@@ -424,20 +436,61 @@ Speaker B: Hi there
 
         assert result is False
 
-    def test_apply_speaker_names_only_replaces_at_line_start(self):
-        """Test that speaker replacement only happens at line start."""
-        self.service.speakers = {"Speaker A": "Bob"}
+    def test_apply_speaker_names_failure_keeps_original(self, tmp_path):
+        """Test that a failed rewrite leaves the transcript untouched and cleans up."""
+        transcript_file = tmp_path / "transcript.txt"
+        transcript_file.write_bytes(b"Speaker A: Hello\n")
+        service = SpeakerNamingService(transcript_file)
+        service.speakers = {"Speaker A": "Bob"}
+
+        with patch("transcripter.speaker_naming_service.os.replace", side_effect=OSError("Disk full")):
+            result = service.apply_speaker_names()
+
+        assert result is False
+        assert transcript_file.read_bytes() == b"Speaker A: Hello\n"
+        assert list(tmp_path.iterdir()) == [transcript_file]
 
-        original_content = """Hello Speaker A: this should not change
+    def test_apply_speaker_names_only_replaces_at_line_start(self, tmp_path):
+        """Test that speaker replacement only happens at line start."""
+        transcript_file = tmp_path / "transcript.txt"
+        transcript_file.write_bytes(b"""Hello Speaker A: this should not change
 Speaker A: This should change to Bob
 Some text Speaker A: also should not change
-"""
+""")
+        service = SpeakerNamingService(transcript_file)
+        service.speakers = {"Speaker A": "Bob"}
 
-
-        with patch("builtins.open", mock_open(read_data=original_content)):
-            result = self.service.apply_speaker_names()
+        result = service.apply_speaker_names()
 
         assert result is True
+        assert transcript_file.read_bytes() == (
+            b"Hello Speaker A: this should not change\n"
+            b"Bob: This should change to Bob\n"
+            b"Some text Speaker A: also should not change\n"
+        )
+
+    def test_apply_speaker_names_matches_whole_label(self, tmp_path):
+        """Test that a label is only replaced when it is the whole text before the colon."""
+        transcript_file = tmp_path / "transcript.txt"
+        transcript_file.write_bytes(b"Speaker AB: Hi: there\nSpeaker A: Time is 10:30\n")
+        service = SpeakerNamingService(transcript_file)
+        service.speakers = {"Speaker A": "Bob", "Speaker AB": "Speaker AB"}
+
+        assert service.apply_speaker_names() is True
+        assert transcript_file.read_bytes() == b"Speaker AB: Hi: there\nBob: Time is 10:30\n"
+
+    def test_apply_speaker_names_after_analysis(self, tmp_path):
+        """Test analyzing and renaming speakers in a transcript on disk."""
+        transcript_file = tmp_path / "transcript.txt"
+        transcript_file.write_bytes(b"Speaker A: Hello\r\nSpeaker B: Hi there\r\n")
+        service = SpeakerNamingService(transcript_file)
+
+        assert service.analyze_transcript() is True
+        assert service.utterances == [("Speaker A", "Hello"), ("Speaker B", "Hi there")]
+
+        service.speakers["Speaker A"] = "Bob"
+        assert service.apply_speaker_names() is True
+        assert transcript_file.read_bytes() == b"Bob: Hello\r\nSpeaker B: Hi there\r\n"
 
     @patch('transcripter.speaker_naming_service.SpeakerNamingService.analyze_transcript')
     @patch('transcripter.speaker_naming_service.SpeakerNamingService.process_speaker_naming')
@@ -1,342 +1,839 @@
 """Tests for transcription service."""
 
+import asyncio
+import os
+import stat
+import time
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import assemblyai as aai
+import httpx
 import pytest
+from assemblyai import Transcriber
 
+from transcripter.audio_chunking import AudioChunk
 from transcripter.config import TranscripterConfig
 from transcripter.models import SpeakerUtterance, TranscriptionResult
 from transcripter.transcription_service import TranscripterService, TranscriptionError
 
+_WEBHOOK_URL = "https://example.com/hook"
 
-class TestTranscripterService:
-    """Test TranscripterService class."""
-
-    def test_init_without_api_key(self):
-        """Test initialization without API key raises error."""
-        config = TranscripterConfig(assemblyai_api_key="")
-
-        with pytest.raises(TranscriptionError, match="AssemblyAI API key is required"):
-            TranscripterService(config)
-
-    def test_init_with_api_key(self):
-        """Test initialization with API key."""
-        config = TranscripterConfig(assemblyai_api_key="test_key")
-
-        with patch('transcripter.transcription_service.aai.settings') as mock_settings:
-            service = TranscripterService(config)
-            mock_settings.api_key = "test_key"
-            assert service.config == config
-
-    @patch('transcripter.transcription_service.aai.Transcriber')
-    def test_transcribe_file_success(self, mock_transcriber_class):
-        """Test successful transcription."""
-        # Setup
-        config = TranscripterConfig(assemblyai_api_key="test_key")
-        service = TranscripterService(config)
-
-        # Mock transcript result
-        mock_utterance = Mock()
-        mock_utterance.speaker = "A"
-        mock_utterance.text = "Hello world"
-        mock_utterance.start = 1000
-        mock_utterance.end = 3000
-        mock_utterance.confidence = 0.95
-
-        mock_transcript = Mock()
-        mock_transcript.status = aai.TranscriptStatus.completed
-        mock_transcript.utterances = [mock_utterance]
-        mock_transcript.audio_duration = 5
-
-        # Mock transcriber instance
-        mock_transcriber = Mock()
-        mock_transcriber.transcribe.return_value = mock_transcript
-        mock_transcriber.get_transcript.return_value = mock_transcript
-        mock_transcriber_class.return_value = mock_transcriber
-
-        # Test
-        audio_file = Path("test.mp3")
-        with patch('pathlib.Path.exists', return_value=True):
-            result = service.transcribe_file(audio_file)
-
-        # Verify
-        assert isinstance(result, TranscriptionResult)
-        assert len(result.utterances) == 1
-        assert result.utterances[0].speaker == "A"
-        assert result.utterances[0].text == "Hello world"
-        assert result.total_duration == 5
-
-    def test_transcribe_file_not_found(self):
-        """Test transcription with non-existent file."""
-        config = TranscripterConfig(assemblyai_api_key="test_key")
-
-        with patch('transcripter.transcription_service.aai.settings'):
-            service = TranscripterService(config)
-
-            with pytest.raises(TranscriptionError, match="Audio file not found"):
-                service.transcribe_file(Path("nonexistent.mp3"))
-
-    @patch('transcripter.transcription_service.aai.Transcriber')
-    def test_transcribe_file_error_status(self, mock_transcriber_class):
-        """Test transcription with error status."""
-        config = TranscripterConfig(assemblyai_api_key="test_key")
-        service = TranscripterService(config)
-
-        # Mock transcript with error
-        mock_transcript = Mock()
-        mock_transcript.status = aai.TranscriptStatus.error
-        mock_transcript.error = "Transcription failed"
-
-        mock_transcriber = Mock()
-        mock_transcriber.transcribe.return_value = mock_transcript
-        mock_transcriber.get_transcript.return_value = mock_transcript
-        mock_transcriber_class.return_value = mock_transcriber
-
-        # Create a temporary file for testing
-        with patch('pathlib.Path.exists', return_value=True):
-            with patch('transcripter.transcription_service.aai.TranscriptionConfig') as mock_config:
-                mock_config.return_value = Mock()
-                with pytest.raises(TranscriptionError, match="Transcription failed"):
-                    service.transcribe_file(Path("test.mp3"))
-
-    def test_process_transcript_with_utterances(self):
-        """Test processing transcript with speaker utterances."""
-        config = TranscripterConfig(assemblyai_api_key="test_key")
-        service = TranscripterService(config)
-
-        # Mock transcript with utterances
-        mock_utterance = Mock()
-        mock_utterance.speaker = "A"
-        mock_utterance.text = "Hello world"
-        mock_utterance.start = 1000
-        mock_utterance.end = 3000
-        mock_utterance.confidence = 0.95
-
-        mock_transcript = Mock()
-        mock_transcript.utterances = [mock_utterance]
-        mock_transcript.audio_duration = 5
-
-        # Test
-        result = service._process_transcript(mock_transcript, Path("test.mp3"), 1500)
-
-        # Verify
-        assert len(result.utterances) == 1
-        assert result.utterances[0].speaker == "A"
-        assert result.utterances[0].text == "Hello world"
-        assert result.utterances[0].start == 1000
-        assert result.utterances[0].end == 3000
-        assert result.utterances[0].confidence == 0.95
-        assert result.total_duration == 5
-        assert result.processing_time_ms == 1500
-
-    def test_process_transcript_fallback(self):
-        """Test processing transcript without utterances (fallback)."""
-        config = TranscripterConfig(assemblyai_api_key="test_key")
-        service = TranscripterService(config)
-
-        # Mock transcript without utterances
-        mock_transcript = Mock()
-        mock_transcript.utterances = None
-        mock_transcript.text = "Hello world"
-        mock_transcript.audio_duration = 5
-        mock_transcript.confidence = 0.95
-
-        # Test
-        result = service._process_transcript(mock_transcript, Path("test.mp3"), 1500)
-
-        # Verify fallback behavior
-        assert len(result.utterances) == 1
-        assert result.utterances[0].speaker == "A"  # Default speaker
-        assert result.utterances[0].text == "Hello world"
-        assert result.utterances[0].start == 0
-        assert result.utterances[0].end == 5
-        assert result.utterances[0].confidence == 0.95
-
-    def test_save_transcript_txt(self):
-        """Test saving transcript in text format."""
-        config = TranscripterConfig(assemblyai_api_key="test_key")
-        service = TranscripterService(config)
-
-        # Create test result
-        utterances = [
-            SpeakerUtterance(
-                speaker="A",
-                text="Hello world",
-                start=1000,
-                end=3000
-            )
-        ]
-        result = TranscriptionResult(
-            utterances=utterances,
-            audio_file=Path("test.mp3")
-        )
 
-        # Test saving
-        output_path = Path("test_output.txt")
-
-        with patch('pathlib.Path.mkdir') as mock_mkdir, \
-             patch('builtins.open', create=True) as mock_open:
-
-            service.save_transcript(result, output_path, "txt")
-
-            # Verify directory creation
-            mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-
-            # Verify file writing
-            mock_open.assert_called_once_with(output_path, 'w', encoding='utf-8')
-
-    def test_save_transcript_srt(self):
-        """Test saving transcript in SRT format."""
-        config = TranscripterConfig(assemblyai_api_key="test_key")
-        service = TranscripterService(config)
-
-        # Create test result
-        utterances = [
-            SpeakerUtterance(
-                speaker="A",
-                text="Hello world",
-                start=1000,
-                end=3000
-            )
-        ]
-        result = TranscriptionResult(
-            utterances=utterances,
-            audio_file=Path("test.mp3")
-        )
+@pytest.fixture
+def audio_file_exists(monkeypatch):
+    """Make .mp3 paths stat as a regular 1 KiB file without touching the disk."""
+    audio_stat = os.stat_result((stat.S_IFREG | 0o644, 0, 0, 1, 0, 0, 1024, 0, 0, 0))
+    real_stat = Path.stat
+
+    def fake_stat(self, **kwargs):
+        return audio_stat if self.suffix == ".mp3" else real_stat(self, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", fake_stat)
+
+
+def _utterance(**overrides):
+    """An SDK utterance stand-in saying "Hello world" as speaker A, unless overridden."""
+    return SimpleNamespace(**{
+        "speaker": "A", "text": "Hello world", "start": 1000, "end": 3000, "confidence": 0.95, **overrides,
+    })
+
+
+def _sentiment(**overrides):
+    """An SDK sentiment segment stand-in for speaker A's "Hello world", unless overridden."""
+    return SimpleNamespace(**{
+        "text": "Hello world", "sentiment": "POSITIVE", "confidence": 0.92, "start": 1000, "end": 3000, "speaker": "A",
+        **overrides,
+    })
+
+
+def _transcript(status=aai.TranscriptStatus.completed, **overrides):
+    """An SDK transcript stand-in with one "Hello" utterance, completed unless overridden."""
+    return SimpleNamespace(**{
+        "id": "transcript-id", "status": status, "error": None, "text": "", "confidence": None, "audio_duration": 1,
+        "utterances": [_utterance(text="Hello", start=0, end=1000, confidence=0.9)], "sentiment_analysis": [],
+        **overrides,
+    })
 
-        # Test saving
-        output_path = Path("test_output.srt")
-
-        with patch('pathlib.Path.mkdir') as mock_mkdir, \
-             patch('builtins.open', create=True) as mock_open:
-
-            service.save_transcript(result, output_path, "srt")
-
-            # Verify directory creation and file writing
-            mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-            mock_open.assert_called_once_with(output_path, 'w', encoding='utf-8')
-
-    @patch('transcripter.transcription_service.aai.Transcriber')
-    def test_transcribe_file_with_sentiment_analysis(self, mock_transcriber_class):
-        """Test transcription with sentiment analysis enabled."""
-        # Setup
-        config = TranscripterConfig(assemblyai_api_key="test_key")
-        service = TranscripterService(config)
-
-        # Mock utterance
-        mock_utterance = Mock()
-        mock_utterance.speaker = "A"
-        mock_utterance.text = "This is great!"
-        mock_utterance.start = 1000
-        mock_utterance.end = 3000
-        mock_utterance.confidence = 0.95
-
-        # Mock sentiment
-        mock_sentiment = Mock()
-        mock_sentiment.text = "This is great!"
-        mock_sentiment.sentiment = "POSITIVE"
-        mock_sentiment.confidence = 0.92
-        mock_sentiment.start = 1000
-        mock_sentiment.end = 3000
-        mock_sentiment.speaker = "A"
-
-        # Mock transcript result
-        mock_transcript = Mock()
-        mock_transcript.status = aai.TranscriptStatus.completed
-        mock_transcript.utterances = [mock_utterance]
-        mock_transcript.sentiment_analysis = [mock_sentiment]
-        mock_transcript.audio_duration = 5
-
-        # Mock transcriber instance
-        mock_transcriber = Mock()
-        mock_transcriber.transcribe.return_value = mock_transcript
-        mock_transcriber_class.return_value = mock_transcriber
-
-        # Test with sentiment analysis enabled
-        audio_file = Path("test.mp3")
-        with patch('pathlib.Path.exists', return_value=True):
-            result = service.transcribe_file(audio_file, enable_sentiment_analysis=True)
-
-        # Verify
-        assert isinstance(result, TranscriptionResult)
-        assert len(result.utterances) == 1
+
+@pytest.fixture
+def service(transcripter_config):
+    """A service on the session's shared config.
+
+    Built per test: the service caches its SDK transcriber and transcription
+    configs, which tests replace with patched classes.
+    """
+    return TranscripterService(transcripter_config)
+
+
+@pytest.fixture
+def transcript_api(monkeypatch, service):
+    """Stand in for AssemblyAI's HTTP API underneath the SDK's own client.
+
+    Uploads are accepted, and transcript requests are answered with
+    ``statuses`` in order, repeating the last one; all are recorded in
+    ``requests``. The first ``failures`` requests get a server error instead.
+    Depends on ``service`` so the SDK has an API key to build its default
+    client with.
+    """
+    api = SimpleNamespace(statuses=["completed"], requests=[], failures=0)
+
+    def handle(request):
+        api.requests.append(request)
+        if len(api.requests) > 100:
+            raise RuntimeError("runaway polling")
+        if len(api.requests) <= api.failures:
+            return httpx.Response(500, json={"error": "Internal server error"})
+        if request.url.path == "/v2/upload":
+            return httpx.Response(200, json={"upload_url": "https://example.com/a.mp3"})
+        status = api.statuses.pop(0) if len(api.statuses) > 1 else api.statuses[0]
+        transcript_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"id": transcript_id, "status": status, "audio_url": "https://example.com/a.mp3"})
+
+    client = aai.Client.get_default()
+    monkeypatch.setattr(
+        client, "_http_client", httpx.Client(base_url=client.settings.base_url, transport=httpx.MockTransport(handle))
+    )
+    return api
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Make time.sleep advance time.monotonic instantly instead of waiting.
+
+    The fake clock starts at the real one, so it never runs backwards for
+    anything, like the service's rate limiter, that has already read it.
+    """
+    clock = [time.monotonic()]
+
+    def fake_sleep(delay):
+        clock[0] += delay
+
+    monkeypatch.setattr("transcripter.transcription_service.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("transcripter.transcription_service.time.sleep", fake_sleep)
+    return clock
+
+
+@pytest.fixture
+def webhook_service(transcripter_config):
+    """A service on the session's shared config with a webhook URL set."""
+    return TranscripterService(transcripter_config.model_copy(update={"webhook_url": _WEBHOOK_URL}))
+
+
+def test_init_without_api_key():
+    """Test initialization without API key raises error."""
+    config = TranscripterConfig(assemblyai_api_key="")
+
+    with pytest.raises(TranscriptionError, match="AssemblyAI API key is required"):
+        TranscripterService(config)
+
+
+def test_init_with_api_key(transcripter_config):
+    """Test initialization with API key."""
+    with patch('transcripter.transcription_service.aai.settings') as mock_settings:
+        service = TranscripterService(transcripter_config)
+        mock_settings.api_key = "test_key"
+        assert service.config == transcripter_config
+
+
+@patch('transcripter.transcription_service.aai.Transcriber')
+def test_transcribe_file_success(mock_transcriber_class, service, audio_file_exists):
+    """Test successful transcription."""
+    # Mock transcript result
+    mock_transcript = SimpleNamespace(
+        status=aai.TranscriptStatus.completed,
+        utterances=[_utterance()],
+        audio_duration=5,
+    )
+
+    # Mock transcriber instance
+    mock_transcriber = Mock(spec_set=Transcriber)
+    mock_transcriber.submit.return_value = mock_transcript
+    mock_transcriber_class.return_value = mock_transcriber
+
+    # Test
+    audio_file = Path("test.mp3")
+    result = service.transcribe_file(audio_file)
+
+    # Verify
+    assert isinstance(result, TranscriptionResult)
+    assert len(result.utterances) == 1
+    assert result.utterances[0].speaker == "A"
+    assert result.utterances[0].text == "Hello world"
+    assert result.total_duration == 5
+
+
+def test_transcribe_file_not_found(service):
+    """Test transcription with non-existent file."""
+    with pytest.raises(TranscriptionError, match="Audio file not found"):
+        service.transcribe_file(Path("nonexistent.mp3"))
+
+
+@patch('transcripter.transcription_service.aai.TranscriptionConfig')
+@patch('transcripter.transcription_service.aai.Transcriber')
+def test_transcribe_file_error_status(mock_transcriber_class, mock_config_class, service, audio_file_exists):
+    """Test transcription with error status."""
+    # Mock transcript with error
+    mock_transcript = SimpleNamespace(status=aai.TranscriptStatus.error, error="Transcription failed")
+
+    mock_transcriber = Mock(spec_set=Transcriber)
+    mock_transcriber.submit.return_value = mock_transcript
+    mock_transcriber_class.return_value = mock_transcriber
+
+    with pytest.raises(TranscriptionError, match="Transcription failed"):
+        service.transcribe_file(Path("test.mp3"))
+
+
+@pytest.mark.parametrize(("sentiment_enabled", "sentiment_analysis", "expected_sentiments"), [
+    pytest.param(False, None, None, id="no-sentiment"),
+    pytest.param(
+        False,
+        [{"sentiment": "NEGATIVE", "confidence": 0.88}],
+        None,
+        id="sentiment-not-requested",
+    ),
+    pytest.param(
+        True,
+        [{"sentiment": "NEGATIVE", "confidence": 0.88}],
+        [("NEGATIVE", 0.88, "A")],
+        id="with-sentiment",
+    ),
+])
+def test_process_transcript(service, sentiment_enabled, sentiment_analysis, expected_sentiments):
+    """Test processing transcript utterances, with and without sentiment analysis."""
+    # Mock transcript
+    mock_transcript = SimpleNamespace(
+        utterances=[_utterance()],
+        audio_duration=5,
+        sentiment_analysis=[_sentiment(**sentiment) for sentiment in sentiment_analysis or []],
+    )
+
+    # Test
+    result = service._process_transcript(
+        mock_transcript,
+        Path("test.mp3"),
+        1500,
+        sentiment_analysis_enabled=sentiment_enabled
+    )
+
+    # Verify
+    assert len(result.utterances) == 1
+    assert result.utterances[0].speaker == "A"
+    assert result.utterances[0].text == "Hello world"
+    assert result.utterances[0].start == 1000
+    assert result.utterances[0].end == 3000
+    assert result.utterances[0].confidence == 0.95
+    assert result.total_duration == 5
+    assert result.processing_time_ms == 1500
+    if expected_sentiments is None:
+        assert result.sentiment_results is None
+    else:
         assert result.sentiment_results is not None
-        assert len(result.sentiment_results) == 1
-        assert result.sentiment_results[0].sentiment == "POSITIVE"
-        assert result.sentiment_results[0].confidence == 0.92
-        assert result.sentiment_results[0].speaker == "A"
-
-    def test_process_transcript_with_sentiment(self):
-        """Test processing transcript with sentiment analysis results."""
-        config = TranscripterConfig(assemblyai_api_key="test_key")
-        service = TranscripterService(config)
-
-        # Mock utterance
-        mock_utterance = Mock()
-        mock_utterance.speaker = "A"
-        mock_utterance.text = "This is terrible."
-        mock_utterance.start = 1000
-        mock_utterance.end = 3000
-        mock_utterance.confidence = 0.95
-
-        # Mock sentiment
-        mock_sentiment = Mock()
-        mock_sentiment.text = "This is terrible."
-        mock_sentiment.sentiment = "NEGATIVE"
-        mock_sentiment.confidence = 0.88
-        mock_sentiment.start = 1000
-        mock_sentiment.end = 3000
-        mock_sentiment.speaker = "A"
-
-        # Mock transcript
-        mock_transcript = Mock()
-        mock_transcript.utterances = [mock_utterance]
-        mock_transcript.sentiment_analysis = [mock_sentiment]
-        mock_transcript.audio_duration = 5
-
-        # Test with sentiment analysis enabled
-        result = service._process_transcript(
-            mock_transcript,
-            Path("test.mp3"),
-            1500,
-            sentiment_analysis_enabled=True
+        assert [(r.sentiment, r.confidence, r.speaker) for r in result.sentiment_results] == expected_sentiments
+
+
+def test_process_transcript_fallback(service):
+    """Test processing transcript without utterances (fallback)."""
+    # Mock transcript without utterances
+    mock_transcript = SimpleNamespace(utterances=None, text="Hello world", audio_duration=5, confidence=0.95)
+
+    # Test
+    result = service._process_transcript(mock_transcript, Path("test.mp3"), 1500)
+
+    # Verify fallback behavior
+    assert len(result.utterances) == 1
+    assert result.utterances[0].speaker == "A"  # Default speaker
+    assert result.utterances[0].text == "Hello world"
+    assert result.utterances[0].start == 0
+    assert result.utterances[0].end == 5
+    assert result.utterances[0].confidence == 0.95
+
+
+@pytest.mark.parametrize(("output_format", "filename"), [
+    ("txt", "test_output.txt"),
+    ("srt", "test_output.srt"),
+])
+def test_save_transcript(service, sample_result, output_format, filename):
+    """Test saving transcript in each text format."""
+    # Test saving
+    output_path = Path(filename)
+
+    with patch('pathlib.Path.mkdir') as mock_mkdir, \
+         patch('builtins.open', create=True) as mock_open:
+
+        service.save_transcript(sample_result, output_path, output_format)
+
+        # Verify directory creation and file writing
+        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        mock_open.assert_called_once_with(output_path, 'w', encoding='utf-8', buffering=65536)
+
+
+def test_save_transcript_writes_file(tmp_path, service):
+    """Test that the streamed transcript on disk matches the rendered text."""
+    result = TranscriptionResult(
+        utterances=[
+            SpeakerUtterance(speaker="A", text="Hello world", start=1000, end=3000),
+            SpeakerUtterance(speaker="B", text="Hi", start=3000, end=4000),
+        ],
+        audio_file=Path("test.mp3")
+    )
+
+    service.save_transcript(result, tmp_path / "out" / "t.txt", "txt")
+    service.save_transcript(result, tmp_path / "out" / "t.srt", "SRT")
+
+    assert (tmp_path / "out" / "t.txt").read_text(encoding="utf-8") == result.to_transcript_text()
+    assert (tmp_path / "out" / "t.srt").read_text(encoding="utf-8") == result.to_srt_format()
+
+
+def test_save_transcript_jsonl(tmp_path, service, sample_result):
+    """Test that JSONL output has one line per utterance."""
+    service.save_transcript(sample_result, tmp_path / "t.jsonl", "jsonl")
+
+    assert (tmp_path / "t.jsonl").read_bytes() == b"".join(sample_result.iter_jsonl())
+
+
+def test_save_transcript_async(tmp_path, service, sample_result):
+    """Test that batched async saves each write their transcript."""
+    async def save_all():
+        await asyncio.gather(
+            service.save_transcript_async(sample_result, tmp_path / "t.txt"),
+            service.save_transcript_async(sample_result, tmp_path / "t.srt", "srt"),
         )
 
-        # Verify
-        assert len(result.utterances) == 1
-        assert result.sentiment_results is not None
-        assert len(result.sentiment_results) == 1
-        assert result.sentiment_results[0].sentiment == "NEGATIVE"
-        assert result.sentiment_results[0].confidence == 0.88
-
-    def test_process_transcript_without_sentiment(self):
-        """Test processing transcript without sentiment analysis."""
-        config = TranscripterConfig(assemblyai_api_key="test_key")
-        service = TranscripterService(config)
-
-        # Mock utterance
-        mock_utterance = Mock()
-        mock_utterance.speaker = "A"
-        mock_utterance.text = "Hello world"
-        mock_utterance.start = 1000
-        mock_utterance.end = 3000
-        mock_utterance.confidence = 0.95
-
-        # Mock transcript without sentiment
-        mock_transcript = Mock()
-        mock_transcript.utterances = [mock_utterance]
-        mock_transcript.audio_duration = 5
-
-        # Test without sentiment analysis
-        result = service._process_transcript(
-            mock_transcript,
-            Path("test.mp3"),
-            1500,
-            sentiment_analysis_enabled=False
+    asyncio.run(save_all())
+
+    assert (tmp_path / "t.txt").read_text(encoding="utf-8") == sample_result.to_transcript_text()
+    assert (tmp_path / "t.srt").read_text(encoding="utf-8") == sample_result.to_srt_format()
+
+
+def test_save_transcript_unknown_format(tmp_path, service):
+    """Test that an unsupported format is rejected before anything is written."""
+    result = TranscriptionResult(audio_file=Path("test.mp3"))
+
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        service.save_transcript(result, tmp_path / "t.docx", "docx")
+
+    assert not (tmp_path / "t.docx").exists()
+
+
+@patch('transcripter.transcription_service.aai.Transcriber')
+def test_transcribe_file_with_sentiment_analysis(mock_transcriber_class, service, audio_file_exists):
+    """Test transcription with sentiment analysis enabled."""
+    # Mock transcript result
+    mock_transcript = SimpleNamespace(
+        status=aai.TranscriptStatus.completed,
+        utterances=[_utterance(text="This is great!")],
+        sentiment_analysis=[_sentiment(text="This is great!")],
+        audio_duration=5,
+    )
+
+    # Mock transcriber instance
+    mock_transcriber = Mock(spec_set=Transcriber)
+    mock_transcriber.submit.return_value = mock_transcript
+    mock_transcriber_class.return_value = mock_transcriber
+
+    # Test with sentiment analysis enabled
+    audio_file = Path("test.mp3")
+    result = service.transcribe_file(audio_file, enable_sentiment_analysis=True)
+
+    # Verify
+    assert isinstance(result, TranscriptionResult)
+    assert len(result.utterances) == 1
+    assert result.sentiment_results is not None
+    assert len(result.sentiment_results) == 1
+    assert result.sentiment_results[0].sentiment == "POSITIVE"
+    assert result.sentiment_results[0].confidence == 0.92
+    assert result.sentiment_results[0].speaker == "A"
+
+
+def test_process_transcript_with_sdk_sentiment_models(service):
+    """Test that the SDK's typed sentiment segments convert to plain results."""
+    mock_transcript = SimpleNamespace(
+        utterances=[_utterance(text="Great", start=0, end=500, confidence=0.9)],
+        audio_duration=1,
+        sentiment_analysis=[
+            aai.types.Sentiment(text="Great", start=0, end=500, confidence=0.9, speaker="A", sentiment="POSITIVE"),
+            aai.types.Sentiment(text="Fine", start=500, end=900, confidence=0.7, speaker=None, sentiment="NEUTRAL"),
+        ],
+    )
+
+    result = service._process_transcript(mock_transcript, Path("test.mp3"), 10, sentiment_analysis_enabled=True)
+
+    assert result.sentiment_results is not None
+    assert [(s.sentiment, s.speaker) for s in result.sentiment_results] == [("POSITIVE", "A"), ("NEUTRAL", None)]
+    assert type(result.sentiment_results[0].sentiment) is str
+
+
+@patch('transcripter.transcription_service.aai.Transcriber')
+def test_transcriber_and_config_reused(mock_transcriber_class, service, audio_file_exists):
+    """Test that one transcriber and one config per sentiment flag serve all calls."""
+    mock_transcript = SimpleNamespace(
+        status=aai.TranscriptStatus.completed,
+        utterances=[],
+        text="",
+        audio_duration=0,
+        sentiment_analysis=[],
+    )
+    mock_transcriber_class.return_value.submit.return_value = mock_transcript
+
+    service.transcribe_file(Path("one.mp3"))
+    service.transcribe_file(Path("two.mp3"))
+    service.transcribe_file(Path("three.mp3"), enable_sentiment_analysis=True)
+
+    mock_transcriber_class.assert_called_once()
+    configs = [c.kwargs["config"] for c in mock_transcriber_class.return_value.submit.call_args_list]
+    assert configs[0] is configs[1]
+    assert configs[2] is not configs[0]
+    assert configs[2].sentiment_analysis is True
+
+
+@patch('transcripter.transcription_service.time.sleep')
+@patch('transcripter.transcription_service._fetch_transcript')
+def test_polls_with_exponential_backoff(mock_fetch, mock_sleep, service):
+    """Test that poll delays start short and grow."""
+    completed = _transcript()
+    mock_fetch.side_effect = [
+        _transcript(aai.TranscriptStatus.processing),
+        _transcript(aai.TranscriptStatus.processing),
+        completed,
+    ]
+
+    result = service._wait_for_completion(_transcript(aai.TranscriptStatus.queued))
+
+    assert result is completed
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.25, 0.375, 0.5625]
+    mock_fetch.assert_called_with("transcript-id")
+
+
+@patch('transcripter.transcription_service.time.sleep')
+@patch('transcripter.transcription_service._fetch_transcript')
+def test_poll_delay_is_capped(mock_fetch, mock_sleep, service):
+    """Test that the backoff stops growing at the maximum delay."""
+    mock_fetch.side_effect = [_transcript(aai.TranscriptStatus.processing)] * 15 + [_transcript()]
+
+    service._wait_for_completion(_transcript(aai.TranscriptStatus.queued))
+
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert max(delays) == 10.0
+    assert delays[-1] == 10.0
+
+
+@patch('transcripter.transcription_service.logger')
+def test_progress_logged_every_nth_poll(mock_logger, transcript_api, fake_clock, service):
+    """Test that long waits against the API only log a fraction of their polls."""
+    mock_logger.is_enabled_for.return_value = True
+    transcript_api.statuses = ["processing"] * 24 + ["completed"]
+    started = fake_clock[0]
+
+    service._wait_for_completion(_transcript(aai.TranscriptStatus.queued))
+
+    assert len(transcript_api.requests) == 25
+    progress = [c for c in mock_logger.debug.call_args_list if c.args[0] == "Transcription in progress"]
+    assert [c.kwargs["polls"] for c in progress] == [0, 10, 20]
+    # Logged before the last five sleeps, each at the 10s maximum delay
+    assert progress[-1].kwargs["elapsed_s"] == round(fake_clock[0] - started - 50.0, 1)
+
+
+@patch('transcripter.transcription_service.logger')
+@patch('transcripter.transcription_service.time.sleep')
+@patch('transcripter.transcription_service._fetch_transcript')
+def test_progress_not_logged_above_debug(mock_fetch, mock_sleep, mock_logger, service):
+    """Test that polling doesn't build progress events when debug logging is off."""
+    mock_logger.is_enabled_for.return_value = False
+    mock_fetch.side_effect = [_transcript(aai.TranscriptStatus.processing), _transcript()]
+
+    service._wait_for_completion(_transcript(aai.TranscriptStatus.queued))
+
+    mock_logger.debug.assert_not_called()
+
+
+@patch('transcripter.transcription_service.time.sleep')
+@patch('transcripter.transcription_service._fetch_transcript')
+@patch('transcripter.transcription_service.aai.Transcriber')
+def test_transient_poll_error_does_not_resubmit(
+    mock_transcriber_class, mock_fetch, mock_sleep, service, audio_file_exists
+):
+    """Test that a failed status check is retried on its own, without re-uploading the file."""
+    mock_transcriber = mock_transcriber_class.return_value
+    mock_transcriber.submit.return_value = _transcript(aai.TranscriptStatus.queued)
+    mock_fetch.side_effect = [ConnectionError("reset"), _transcript()]
+
+    service.transcribe_file(Path("test.mp3"))
+
+    mock_transcriber.submit.assert_called_once()
+    assert mock_fetch.call_count == 2
+
+
+@patch('transcripter.transcription_service.time.sleep')
+def test_poll_timeout(mock_sleep, transcripter_config):
+    """Test that polling gives up once max_poll_seconds would be exceeded."""
+    service = TranscripterService(transcripter_config.model_copy(update={"max_poll_seconds": 0}))
+
+    with pytest.raises(TranscriptionError, match="Timed out"):
+        service._wait_for_completion(_transcript(aai.TranscriptStatus.processing))
+
+    mock_sleep.assert_not_called()
+
+
+def test_poll_deadline_enforced_against_api(transcript_api, fake_clock, transcripter_config):
+    """Test that each poll is one status request, so max_poll_seconds holds against the real SDK."""
+    service = TranscripterService(transcripter_config.model_copy(update={"max_poll_seconds": 5}))
+    transcript_api.statuses = ["processing"]
+
+    with pytest.raises(TranscriptionError, match="Timed out"):
+        service._wait_for_completion(_transcript(aai.TranscriptStatus.queued))
+
+    # Polls after 0.25s, 0.625s, 1.19s, 2.03s and 3.3s; the next would pass 5s
+    assert len(transcript_api.requests) == 5
+    assert {(r.method, r.url.path) for r in transcript_api.requests} == {("GET", "/v2/transcript/transcript-id")}
+
+
+def test_poll_returns_finished_transcript_from_api(transcript_api, fake_clock, service):
+    """Test that polling through the SDK stops at the first finished status."""
+    transcript_api.statuses = ["queued", "processing", "completed"]
+
+    transcript = service._wait_for_completion(_transcript(aai.TranscriptStatus.queued))
+
+    assert transcript.status == aai.TranscriptStatus.completed
+    assert len(transcript_api.requests) == 3
+
+
+def test_failed_poll_request_retried_against_api(transcript_api, fake_clock, service):
+    """Test that a failed status request is retried on its own after a backoff."""
+    transcript_api.failures = 1
+    started = fake_clock[0]
+
+    transcript = service._poll_with_retry("transcript-id")
+
+    assert transcript.status == aai.TranscriptStatus.completed
+    assert len(transcript_api.requests) == 2
+    assert fake_clock[0] - started == 2
+
+
+@patch('transcripter.transcription_service.aai.TranscriptionConfig')
+@patch('transcripter.transcription_service.aai.Transcriber')
+def test_webhook_url_only_sent_by_submit(mock_transcriber_class, mock_config_class, audio_file_exists, webhook_service):
+    """Test that only submit asks for a callback; polling transcriptions would be unknown to handle_webhook."""
+    mock_transcriber_class.return_value.submit.return_value = _transcript()
+
+    webhook_service.transcribe_file(Path("test.mp3"))
+    webhook_service.submit(Path("test.mp3"))
+
+    assert [c.kwargs["webhook_url"] for c in mock_config_class.call_args_list] == [None, _WEBHOOK_URL]
+
+
+@patch('transcripter.transcription_service.asyncio.sleep')
+@patch('transcripter.transcription_service._fetch_transcript')
+@patch('transcripter.transcription_service.aai.Transcriber')
+def test_transcribe_file_async(mock_transcriber_class, mock_fetch, mock_sleep, service, audio_file_exists):
+    """Test that the async variant submits once and polls with async sleeps."""
+    mock_transcriber_class.return_value.submit.return_value = _transcript(aai.TranscriptStatus.queued)
+    mock_fetch.side_effect = [_transcript(aai.TranscriptStatus.processing), _transcript()]
+
+    result = asyncio.run(service.transcribe_file_async(Path("test.mp3")))
+
+    assert result.utterances[0].text == "Hello"
+    mock_transcriber_class.return_value.submit.assert_called_once()
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.25, 0.375]
+
+
+@patch('transcripter.transcription_service._fetch_transcript')
+def test_await_completion_timeout(mock_fetch, transcripter_config):
+    """Test that async polling gives up after max_poll_seconds."""
+    service = TranscripterService(transcripter_config.model_copy(update={"max_poll_seconds": 0.01}))
+    mock_fetch.return_value = _transcript(aai.TranscriptStatus.processing)
+
+    with pytest.raises(TranscriptionError, match="Timed out"):
+        asyncio.run(service._await_completion("transcript-id"))
+
+
+def test_async_poll_holds_a_thread_per_request_only(transcript_api, monkeypatch, service):
+    """Test that async polling sleeps on the event loop and uses worker threads for single requests."""
+    transcript_api.statuses = ["processing", "processing", "completed"]
+    requests_per_thread = []
+    to_thread = asyncio.to_thread
+
+    async def counting_to_thread(func, *args):
+        before = len(transcript_api.requests)
+        result = await to_thread(func, *args)
+        requests_per_thread.append(len(transcript_api.requests) - before)
+        return result
+
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr("transcripter.transcription_service.asyncio.to_thread", counting_to_thread)
+    monkeypatch.setattr("transcripter.transcription_service.asyncio.sleep", no_sleep)
+
+    transcript = asyncio.run(service._await_completion("transcript-id"))
+
+    assert transcript.status == aai.TranscriptStatus.completed
+    assert requests_per_thread == [1, 1, 1]
+
+
+@pytest.mark.parametrize("run_async", [False, True], ids=["sync", "async"])
+def test_rate_limit_token_per_api_request(run_async, transcript_api, fake_clock, monkeypatch, service, tmp_path):
+    """Test that the upload, the transcript creation and every status poll each take a rate limit token."""
+    transcript_api.statuses = ["queued", "processing", "processing", "completed"]
+    audio_file = tmp_path / "meeting.mp3"
+    audio_file.write_bytes(b"audio")
+    tokens = []
+    acquire, wait = service._rate_limiter.acquire, service._rate_limiter.wait
+
+    async def counting_acquire(n=1):
+        tokens.append(n)
+        await acquire(n)
+
+    def counting_wait(n=1):
+        tokens.append(n)
+        wait(n)
+
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(service._rate_limiter, "acquire", counting_acquire)
+    monkeypatch.setattr(service._rate_limiter, "wait", counting_wait)
+    monkeypatch.setattr("transcripter.transcription_service.asyncio.sleep", no_sleep)
+
+    if run_async:
+        asyncio.run(service.transcribe_file_async(audio_file))
+    else:
+        service.transcribe_file(audio_file)
+
+    assert len(transcript_api.requests) == 5
+    assert sum(tokens) == len(transcript_api.requests)
+
+
+def test_transcribe_files_keeps_order_and_failures(service):
+    """Test that batch results line up with inputs and failures don't abort the batch."""
+    async def fake_transcribe(path, enable_sentiment_analysis):
+        if path.name == "bad.mp3":
+            raise TranscriptionError("boom")
+        return TranscriptionResult(audio_file=path)
+
+    paths = [Path("a.mp3"), Path("bad.mp3"), Path("c.mp3")]
+    with patch.object(service, 'transcribe_file_async', side_effect=fake_transcribe):
+        results = asyncio.run(service.transcribe_files(paths))
+
+    assert isinstance(results[0], TranscriptionResult)
+    assert results[0].audio_file == Path("a.mp3")
+    assert isinstance(results[1], TranscriptionError)
+    assert isinstance(results[2], TranscriptionResult)
+    assert results[2].audio_file == Path("c.mp3")
+
+
+@pytest.mark.parametrize(
+    ("max_concurrent", "configured", "expected_peak"),
+    [(2, 5, 2), (None, 3, 3)],
+    ids=["explicit-limit", "limit-from-config"],
+)
+def test_transcribe_files_limits_concurrency(max_concurrent, configured, expected_peak, transcripter_config):
+    """Test that no more than max_concurrent transcriptions run at once, defaulting to the configured limit."""
+    service = TranscripterService(
+        transcripter_config.model_copy(update={"max_concurrent_transcriptions": configured})
+    )
+    active = 0
+    peak = 0
+
+    async def fake_transcribe(path, enable_sentiment_analysis):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return TranscriptionResult(audio_file=path)
+
+    paths = [Path(f"{i}.mp3") for i in range(6)]
+    with patch.object(service, 'transcribe_file_async', side_effect=fake_transcribe):
+        results = asyncio.run(service.transcribe_files(paths, max_concurrent=max_concurrent))
+
+    assert len(results) == 6
+    assert peak == expected_peak
+
+
+def _submit(service):
+    """Submit meeting.mp3 through a fake transcriber, returning its transcript ID."""
+    with patch('transcripter.transcription_service.aai.Transcriber') as mock_transcriber_class, \
+         patch('pathlib.Path.stat'):
+        mock_transcriber_class.return_value.submit.return_value = _transcript(aai.TranscriptStatus.queued)
+        return service.submit(Path("meeting.mp3"))
+
+
+@patch('transcripter.transcription_service._fetch_transcript')
+def test_webhook_resolves_result(mock_fetch, webhook_service):
+    """Test that a webhook call lets await_result fetch the transcript once."""
+    mock_fetch.return_value = _transcript()
+    transcript_id = _submit(webhook_service)
+
+    assert webhook_service.handle_webhook({"transcript_id": transcript_id, "status": "completed"}) is True
+    result = webhook_service.await_result(transcript_id)
+
+    assert transcript_id == "transcript-id"
+    assert result.audio_file == Path("meeting.mp3")
+    assert result.utterances[0].text == "Hello"
+    mock_fetch.assert_called_once_with("transcript-id")
+
+
+def test_webhook_for_unknown_transcript(webhook_service):
+    """Test that webhooks for transcripts we didn't submit are ignored."""
+    assert webhook_service.handle_webhook({"transcript_id": "other", "status": "completed"}) is False
+
+
+def test_await_unknown_transcript(service):
+    """Test that awaiting an unknown transcript ID fails."""
+    with pytest.raises(TranscriptionError, match="Unknown transcript ID"):
+        service.await_result("missing")
+
+
+def test_await_times_out_without_webhook(transcripter_config):
+    """Test that await_result gives up when the webhook never arrives."""
+    service = TranscripterService(
+        transcripter_config.model_copy(update={"webhook_url": _WEBHOOK_URL, "max_poll_seconds": 0})
+    )
+    transcript_id = _submit(service)
+
+    with pytest.raises(TranscriptionError, match="Timed out"):
+        service.await_result(transcript_id)
+
+
+@patch('transcripter.transcription_service._fetch_transcript')
+def test_await_polls_without_webhook_url(mock_fetch, service):
+    """Test that await_result polls when no webhook URL is configured."""
+    mock_fetch.return_value = _transcript()
+    transcript_id = _submit(service)
+
+    result = service.await_result(transcript_id)
+
+    assert len(result.utterances) == 1
+
+
+@patch('transcripter.transcription_service.WEBHOOK_CHECK_INTERVAL', 0)
+@patch('transcripter.transcription_service._fetch_transcript')
+def test_await_checks_status_when_webhook_missed(mock_fetch, webhook_service):
+    """Test that a callback lost or sent before registration doesn't leave await_result waiting forever."""
+    mock_fetch.side_effect = [_transcript(aai.TranscriptStatus.processing), _transcript()]
+    transcript_id = _submit(webhook_service)
+
+    result = webhook_service.await_result(transcript_id)
+
+    assert result.utterances[0].text == "Hello"
+    assert mock_fetch.call_count == 2
+
+
+@patch('transcripter.transcription_service.WEBHOOK_CHECK_INTERVAL', 0.01)
+def test_missed_webhook_times_out_against_api(transcript_api, transcripter_config):
+    """Test that status checks while waiting for a webhook are single requests bounded by the deadline."""
+    service = TranscripterService(
+        transcripter_config.model_copy(update={"webhook_url": _WEBHOOK_URL, "max_poll_seconds": 0.1})
+    )
+    transcript_id = _submit(service)
+    transcript_api.statuses = ["processing"]
+
+    with pytest.raises(TranscriptionError, match="Timed out"):
+        service.await_result(transcript_id)
+
+    # About one request per 10ms check within the 100ms deadline
+    assert 1 <= len(transcript_api.requests) <= 11
+
+
+@patch('transcripter.transcription_service.aai.Transcriber')
+def test_identical_audio_transcribed_once(mock_transcriber_class, tmp_path, transcripter_config):
+    """Test that a second file with the same content is served from the cache."""
+    service = TranscripterService(transcripter_config.model_copy(update={"cache_dir": tmp_path / "cache"}))
+    mock_transcriber = mock_transcriber_class.return_value
+    mock_transcriber.submit.return_value = _transcript()
+    first_file = tmp_path / "first.mp3"
+    second_file = tmp_path / "second.mp3"
+    first_file.write_bytes(b"audio")
+    second_file.write_bytes(b"audio")
+
+    first = service.transcribe_file(first_file)
+    second = service.transcribe_file(second_file)
+
+    mock_transcriber.submit.assert_called_once()
+    assert second.utterances == first.utterances
+    assert second.audio_file == second_file
+
+
+@patch('transcripter.transcription_service.aai.Transcriber')
+def test_cache_keyed_by_sentiment_setting(mock_transcriber_class, tmp_path, transcripter_config):
+    """Test that enabling sentiment analysis doesn't reuse a result without it."""
+    service = TranscripterService(transcripter_config.model_copy(update={"cache_dir": tmp_path / "cache"}))
+    mock_transcriber = mock_transcriber_class.return_value
+    mock_transcriber.submit.return_value = _transcript()
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_bytes(b"audio")
+
+    service.transcribe_file(audio_file)
+    service.transcribe_file(audio_file, enable_sentiment_analysis=True)
+
+    assert mock_transcriber.submit.call_count == 2
+
+
+@patch('transcripter.transcription_service.aai.Transcriber')
+def test_unreadable_cache_entry_ignored(mock_transcriber_class, tmp_path, transcripter_config):
+    """Test that a corrupt cache file falls back to transcribing."""
+    cache_dir = tmp_path / "cache"
+    service = TranscripterService(transcripter_config.model_copy(update={"cache_dir": cache_dir}))
+    mock_transcriber = mock_transcriber_class.return_value
+    mock_transcriber.submit.return_value = _transcript()
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_bytes(b"audio")
+    cache_path = service._cache_path(audio_file, False)
+    assert cache_path is not None
+    cache_dir.mkdir()
+    cache_path.write_text("not json")
+
+    result = service.transcribe_file(audio_file)
+
+    mock_transcriber.submit.assert_called_once()
+    assert result.utterances[0].text == "Hello"
+
+
+@patch('transcripter.transcription_service.shutil.which', return_value=None)
+def test_parallel_requires_ffmpeg(mock_which, service):
+    """Test that a missing ffmpeg is reported as a transcription error."""
+    with pytest.raises(TranscriptionError, match="ffmpeg"):
+        asyncio.run(service.transcribe_file_parallel(Path("long.mp3")))
+
+
+@patch('transcripter.transcription_service.shutil.which', return_value="/usr/bin/ffmpeg")
+@patch('transcripter.transcription_service.split_audio')
+def test_parallel_chunks_transcribed_and_stitched(mock_split, mock_which, service):
+    """Test that each chunk is transcribed and the results merged onto the original timeline."""
+    mock_split.return_value = [
+        AudioChunk(Path("c0.flac"), 0, 0, 300_000),
+        AudioChunk(Path("c1.flac"), 285_000, 300_000, None),
+    ]
+
+    async def fake_transcribe(path, enable_sentiment_analysis):
+        return TranscriptionResult(
+            audio_file=path,
+            utterances=[SpeakerUtterance(speaker="A", text=path.stem, start=20_000, end=21_000)],
         )
 
-        # Verify sentiment_results is None
-        assert len(result.utterances) == 1
-        assert result.sentiment_results is None
+    with patch.object(service, 'transcribe_file_async', side_effect=fake_transcribe):
+        result = asyncio.run(service.transcribe_file_parallel(Path("long.mp3")))
+
+    assert result.audio_file == Path("long.mp3")
+    assert [(u.text, u.start) for u in result.utterances] == [("c0", 20_000), ("c1", 305_000)]
+
+
+@patch('transcripter.transcription_service.shutil.which', return_value="/usr/bin/ffmpeg")
+@patch('transcripter.transcription_service.split_audio')
+def test_parallel_failed_chunk_fails_transcription(mock_split, mock_which, service):
+    """Test that a chunk failure is surfaced rather than silently dropping audio."""
+    mock_split.return_value = [
+        AudioChunk(Path("c0.flac"), 0, 0, 300_000),
+        AudioChunk(Path("c1.flac"), 285_000, 300_000, None),
+    ]
+
+    async def fake_transcribe(path, enable_sentiment_analysis):
+        if path.name == "c1.flac":
+            raise TranscriptionError("boom")
+        return TranscriptionResult(audio_file=path)
+
+    with patch.object(service, 'transcribe_file_async', side_effect=fake_transcribe):
+        with pytest.raises(TranscriptionError, match="1 of 2 chunks"):
+            asyncio.run(service.transcribe_file_parallel(Path("long.mp3")))